@@ -22,6 +22,7 @@ class CameraDiscovery:
     def __init__(self):
         """Initialize the Camera Discovery module"""
         self.timeout = 2  # Timeout for connection attempts (seconds)
+        self.http_timeout = 1.5  # Per-request timeout for HTTP probes (seconds)
     
     def check_device(self, ip: str) -> bool:
         """
@@ -78,7 +79,7 @@ class CameraDiscovery:
                     url = f"http://{ip}{endpoint}"
                     response = requests.head(
                         url,
-                        timeout=self.timeout,
+                        timeout=self.http_timeout,
                         allow_redirects=False
                     )
                     
@@ -113,7 +114,7 @@ class CameraDiscovery:
             try:
                 response = requests.get(
                     f"http://{ip}/",
-                    timeout=self.timeout,
+                    timeout=self.http_timeout,
                     allow_redirects=True
                 )
                 
@@ -181,7 +182,7 @@ class CameraDiscovery:
         try:
             # Try to connect to HTTP port
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
+            sock.settimeout(self.http_timeout)
             result = sock.connect_ex((ip, 80))
             sock.close()
             
@@ -192,7 +193,7 @@ class CameraDiscovery:
                     # We don't authenticate yet, just check if the server responds
                     response = requests.head(
                         f"http://{ip}/", 
-                        timeout=self.timeout,
+                        timeout=self.http_timeout,
                         allow_redirects=False
                     )
                     
@@ -13,14 +13,46 @@ import socket
 import ipaddress
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPDigestAuth
 from typing import Dict, Any, Tuple, Optional, Union, List
-from zeep import Client, Transport
-from zeep.wsse.username import UsernameToken
 from urllib.parse import urljoin
 import xml.etree.ElementTree as ET
 
 
+class CameraSession(requests.Session):
+    """
+    Keep-alive HTTP session for the requests made to a single camera
+    
+    Reusing one session across the configuration steps for a camera saves a
+    TCP (and TLS) handshake per step, and caching the digest auth objects lets
+    later requests answer the camera's challenge without an extra round trip.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.verify = False  # Cameras use self-signed certificates
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+        self._digest_auths = {}
+    
+    def digest_auth(self, username: str, password: str) -> HTTPDigestAuth:
+        """Return the shared digest auth handler for these credentials"""
+        key = (username, password)
+        auth = self._digest_auths.get(key)
+        if auth is None:
+            auth = self._digest_auths[key] = HTTPDigestAuth(username, password)
+        return auth
+
+
+def _digest_auth(session: Optional[CameraSession], username: str, password: str) -> HTTPDigestAuth:
+    """Digest auth for a request, reusing the session's handler when there is one"""
+    if session is None:
+        return HTTPDigestAuth(username, password)
+    return session.digest_auth(username, password)
+
+
 class CameraOperations:
     """VAPIX and ONVIF operations for Axis cameras"""
     
@@ -31,7 +63,8 @@ class CameraOperations:
         self.retry_delay = 2  # Seconds to wait between retries
     
     def create_initial_admin(self, temp_ip: str, new_admin_user: str, 
-                             new_admin_pass: str, protocol: str = "HTTP") -> Tuple[bool, str]:
+                             new_admin_pass: str, protocol: str = "HTTP",
+                             session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Create initial administrator user on a factory-new camera
         
@@ -43,6 +76,7 @@ class CameraOperations:
             new_admin_user: Provided administrator username (ignored, will use 'root')
             new_admin_pass: New administrator password to set
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -71,10 +105,11 @@ class CameraOperations:
         
         # Make the request without authentication (factory-new state)
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
                     timeout=self.timeout,
@@ -95,9 +130,9 @@ class CameraOperations:
                     # This is a common case - the admin was already set up but we're using the same credentials
                     try:
                         auth_check_url = urljoin(base_url, "/axis-cgi/usergroup.cgi")
-                        auth_response = requests.get(
+                        auth_response = http.get(
                             auth_check_url,
-                            auth=HTTPDigestAuth('root', new_admin_pass),
+                            auth=_digest_auth(session, 'root', new_admin_pass),
                             timeout=self.timeout,
                             verify=False
                         )
@@ -158,7 +193,8 @@ class CameraOperations:
     
     def create_secondary_admin(self, temp_ip: str, root_pass: str, 
                               secondary_admin_user: str, secondary_admin_pass: str,
-                              protocol: str = "HTTP") -> Tuple[bool, str]:
+                              protocol: str = "HTTP",
+                              session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Create secondary administrator user on a camera
         
@@ -170,6 +206,7 @@ class CameraOperations:
             secondary_admin_user: Username for the secondary admin to create
             secondary_admin_pass: Password for the secondary admin
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -194,13 +231,14 @@ class CameraOperations:
         
         # Make the request with root authentication
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
-                    auth=HTTPDigestAuth('root', root_pass),  # Always authenticate as root
+                    auth=_digest_auth(session, 'root', root_pass),  # Always authenticate as root
                     timeout=self.timeout,
                     verify=False  # Skip SSL verification for self-signed certs
                 )
@@ -260,7 +298,8 @@ class CameraOperations:
     
     def create_onvif_user(self, temp_ip: str, admin_user: str, admin_pass: str,
                          onvif_user: str, onvif_pass: str, 
-                         protocol: str = "HTTP") -> Tuple[bool, str]:
+                         protocol: str = "HTTP",
+                         session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Create ONVIF user on camera
         
@@ -273,6 +312,7 @@ class CameraOperations:
             onvif_user: ONVIF username to create
             onvif_pass: ONVIF password to set
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -283,7 +323,7 @@ class CameraOperations:
         # This is often easier than using the ONVIF API directly
         try:
             vapix_result = self._create_onvif_user_via_vapix(
-                temp_ip, admin_user, admin_pass, onvif_user, onvif_pass, protocol
+                temp_ip, admin_user, admin_pass, onvif_user, onvif_pass, protocol, session
             )
             
             if vapix_result[0]:
@@ -295,6 +335,10 @@ class CameraOperations:
         
         # If VAPIX method failed, try using ONVIF SOAP API
         try:
+            # zeep is slow to import and only needed for this fallback
+            from zeep import Client, Transport
+            from zeep.wsse.username import UsernameToken
+            
             # Construct the ONVIF device service WSDL URL
             onvif_port = 80 if protocol.lower() == "http" else 443
             wsdl_url = f"{protocol.lower()}://{temp_ip}:{onvif_port}/onvif/device_service"
@@ -364,7 +408,8 @@ class CameraOperations:
     
     def _create_onvif_user_via_vapix(self, temp_ip: str, admin_user: str, admin_pass: str,
                                    onvif_user: str, onvif_pass: str, 
-                                   protocol: str = "HTTP") -> Tuple[bool, str]:
+                                   protocol: str = "HTTP",
+                                   session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Create ONVIF user using VAPIX API (simpler approach than SOAP)
         
@@ -375,6 +420,7 @@ class CameraOperations:
             onvif_user: ONVIF username to create
             onvif_pass: ONVIF password to set
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -397,13 +443,14 @@ class CameraOperations:
         }
         
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
-                    auth=HTTPDigestAuth(admin_user, admin_pass),
+                    auth=_digest_auth(session, admin_user, admin_pass),
                     timeout=self.timeout,
                     verify=False
                 )
@@ -425,10 +472,10 @@ class CameraOperations:
                         "sgrp": "onvif:admin:operator:viewer"  # Ensure correct ONVIF access for OS 10.12
                     }
                     
-                    update_response = requests.get(
+                    update_response = http.get(
                         url,
                         params=update_params,
-                        auth=HTTPDigestAuth(admin_user, admin_pass),
+                        auth=_digest_auth(session, admin_user, admin_pass),
                         timeout=self.timeout,
                         verify=False
                     )
@@ -458,8 +505,61 @@ class CameraOperations:
         
         return False, f"Failed to create ONVIF user via VAPIX after {self.retry_count} attempts"
 
+    def get_image_params(self, temp_ip: str, admin_user: str, admin_pass: str,
+                         protocol: str = "HTTP",
+                         session: Optional[CameraSession] = None) -> Tuple[bool, Dict[str, str]]:
+        """
+        Read the WDR and Replay Protection settings in a single request
+        
+        Args:
+            temp_ip: Camera's temporary DHCP IP address
+            admin_user: Administrator username for authentication
+            admin_pass: Administrator password for authentication
+            protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
+            
+        Returns:
+            Tuple of (success, params) where params maps 'wdr' and
+            'replay_protection' to 'on' or 'off' for each setting that was read
+        """
+        url = urljoin(f"{protocol.lower()}://{temp_ip}", "/axis-cgi/param.cgi")
+        http = session or requests
+        params = {
+            "action": "list",
+            "group": "ImageSource.I0.Sensor.WDR,WebService.UsernameToken.ReplayAttackProtection"
+        }
+        
+        try:
+            response = http.get(
+                url,
+                params=params,
+                auth=_digest_auth(session, admin_user, admin_pass),
+                timeout=self.timeout,
+                verify=False
+            )
+        except requests.exceptions.RequestException as e:
+            logging.debug(f"Could not read image parameters from {temp_ip}: {str(e)}")
+            return False, {}
+        
+        if response.status_code != 200:
+            return False, {}
+        
+        # Response lines look like "root.ImageSource.I0.Sensor.WDR=off"
+        result = {}
+        for line in response.text.splitlines():
+            name, sep, value = line.partition('=')
+            if not sep:
+                continue
+            value = value.strip().lower()
+            if name.endswith('.Sensor.WDR'):
+                result['wdr'] = 'off' if value == 'off' else 'on'
+            elif name.endswith('.ReplayAttackProtection'):
+                result['replay_protection'] = 'off' if value == 'no' else 'on'
+        return True, result
+    
     def set_wdr_off(self, temp_ip: str, admin_user: str, admin_pass: str,
-                    protocol: str = "HTTP") -> Tuple[bool, str]:
+                    protocol: str = "HTTP",
+                    session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Turn off Wide Dynamic Range (WDR) on camera
         
@@ -468,6 +568,7 @@ class CameraOperations:
             admin_user: Administrator username for authentication
             admin_pass: Administrator password for authentication
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -487,13 +588,14 @@ class CameraOperations:
         }
         
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
-                    auth=HTTPDigestAuth(admin_user, admin_pass),
+                    auth=_digest_auth(session, admin_user, admin_pass),
                     timeout=self.timeout,
                     verify=False
                 )
@@ -524,7 +626,8 @@ class CameraOperations:
         return False, f"Failed to turn off WDR after {self.retry_count} attempts"
     
     def set_replay_protection_off(self, temp_ip: str, admin_user: str, admin_pass: str,
-                               protocol: str = "HTTP") -> Tuple[bool, str]:
+                               protocol: str = "HTTP",
+                               session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Turn off Replay Protection on camera
         
@@ -533,6 +636,7 @@ class CameraOperations:
             admin_user: Administrator username for authentication
             admin_pass: Administrator password for authentication
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -552,13 +656,14 @@ class CameraOperations:
         }
         
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
-                    auth=HTTPDigestAuth(admin_user, admin_pass),
+                    auth=_digest_auth(session, admin_user, admin_pass),
                     timeout=self.timeout,
                     verify=False
                 )
@@ -593,7 +698,8 @@ class CameraOperations:
         return False, f"Failed to turn off Replay Protection after {self.retry_count} attempts"
 
     def set_final_static_ip(self, temp_ip: str, admin_user: str, admin_pass: str,
-                           ip_config: Dict[str, str], protocol: str = "HTTP") -> Tuple[bool, str]:
+                           ip_config: Dict[str, str], protocol: str = "HTTP",
+                           session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Set final static IP configuration on camera
         
@@ -604,6 +710,7 @@ class CameraOperations:
             ip_config: Dictionary containing IP configuration details
                        {'ip': '192.168.1.100', 'subnet': '255.255.255.0', 'gateway': '192.168.1.1'}
             protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -622,15 +729,67 @@ class CameraOperations:
         
         # For newer Axis cameras, use the JSON API
         # Try modern API first, then fall back to older methods if needed
-        success, message = self._set_ip_using_json_api(base_url, admin_user, admin_pass, final_ip, subnet, gateway)
+        success, message = self._set_ip_using_json_api(base_url, admin_user, admin_pass, final_ip, subnet, gateway, session)
         
         if success:
             return success, message
         
         # If JSON API failed, try the legacy param.cgi API
         logging.info(f"JSON API failed, trying legacy param.cgi API: {message}")
-        return self._set_ip_using_param_cgi(base_url, admin_user, admin_pass, final_ip, subnet, gateway)
+        return self._set_ip_using_param_cgi(base_url, admin_user, admin_pass, final_ip, subnet, gateway, session)
 
+    def get_camera_mac_serial(self, ip: str, admin_user: str, admin_pass: str,
+                              protocol: str = "HTTP",
+                              session: Optional[CameraSession] = None) -> Tuple[bool, Dict[str, str]]:
+        """
+        Retrieve the serial number and MAC address of a camera
+        
+        Axis cameras use their MAC address as the serial number, so both are
+        derived from the SerialNumber property of the basic device info API.
+        
+        Args:
+            ip: Camera IP address
+            admin_user: Administrator username for authentication
+            admin_pass: Administrator password for authentication
+            protocol: 'HTTP' or 'HTTPS'
+            session: Optional keep-alive session to send the requests on
+            
+        Returns:
+            Tuple of (success, {'serial': str, 'mac': str})
+        """
+        url = urljoin(f"{protocol.lower()}://{ip}", "/axis-cgi/basicdeviceinfo.cgi")
+        http = session or requests
+        payload = {
+            "apiVersion": "1.0",
+            "context": "AxisAutoConfig",
+            "method": "getProperties",
+            "params": {"propertyList": ["SerialNumber"]}
+        }
+        
+        try:
+            response = http.post(
+                url,
+                json=payload,
+                auth=_digest_auth(session, admin_user, admin_pass),
+                timeout=self.timeout,
+                verify=False
+            )
+            if response.status_code != 200:
+                logging.error(f"Failed to read device info from {ip} (HTTP {response.status_code})")
+                return False, {}
+            
+            serial = response.json().get('data', {}).get('propertyList', {}).get('SerialNumber', '')
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logging.error(f"Error reading device info from {ip}: {str(e)}")
+            return False, {}
+        
+        if not serial:
+            return False, {}
+        
+        serial = serial.upper()
+        mac = ':'.join(serial[i:i + 2] for i in range(0, len(serial), 2)) if len(serial) == 12 else ''
+        return True, {'serial': serial, 'mac': mac}
+    
     def _subnet_mask_to_prefix_length(self, subnet_mask: str) -> int:
         """
         Convert a subnet mask to CIDR prefix length
@@ -666,7 +825,8 @@ class CameraOperations:
                 raise ValueError(f"Invalid subnet mask format: {str(e)}")
                 
     def _set_ip_using_json_api(self, base_url: str, admin_user: str, admin_pass: str,
-                              final_ip: str, subnet: str, gateway: str) -> Tuple[bool, str]:
+                              final_ip: str, subnet: str, gateway: str,
+                              session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Set static IP using the modern JSON API
         
@@ -677,6 +837,7 @@ class CameraOperations:
             final_ip: Final static IP address
             subnet: Subnet mask
             gateway: Default gateway
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -701,6 +862,7 @@ class CameraOperations:
         # Modern JSON API endpoint 
         endpoint = "/axis-cgi/network_settings.cgi"
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         # Prepare JSON payload with better structure for Axis OS 10.12
         payload = {
@@ -733,11 +895,11 @@ class CameraOperations:
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.post(
+                response = http.post(
                     url,
                     json=payload,  # This sets the Content-Type header automatically
                     headers=headers,
-                    auth=HTTPDigestAuth(admin_user, admin_pass),
+                    auth=_digest_auth(session, admin_user, admin_pass),
                     timeout=self.timeout,
                     verify=False  # Skip SSL verification
                 )
@@ -791,7 +953,8 @@ class CameraOperations:
         return False, f"Failed to set static IP after {self.retry_count} attempts"
 
     def _set_ip_using_param_cgi(self, base_url: str, admin_user: str, admin_pass: str,
-                               final_ip: str, subnet: str, gateway: str) -> Tuple[bool, str]:
+                               final_ip: str, subnet: str, gateway: str,
+                               session: Optional[CameraSession] = None) -> Tuple[bool, str]:
         """
         Set static IP using the legacy param.cgi API
         
@@ -802,6 +965,7 @@ class CameraOperations:
             final_ip: Final static IP address
             subnet: Subnet mask
             gateway: Default gateway
+            session: Optional keep-alive session to send the requests on
             
         Returns:
             Tuple of (success, message)
@@ -809,6 +973,7 @@ class CameraOperations:
         # Legacy param.cgi API endpoint
         endpoint = "/axis-cgi/param.cgi"
         url = urljoin(base_url, endpoint)
+        http = session or requests
         
         # Parameters for the request - standard format for all Axis OS versions
         params = {
@@ -824,10 +989,10 @@ class CameraOperations:
         
         for attempt in range(self.retry_count):
             try:
-                response = requests.get(
+                response = http.get(
                     url,
                     params=params,
-                    auth=HTTPDigestAuth(admin_user, admin_pass),
+                    auth=_digest_auth(session, admin_user, admin_pass),
                     timeout=self.timeout,
                     verify=False  # Skip SSL verification
                 )
@@ -17,7 +17,11 @@ import logging
 import ipaddress
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Union, Tuple, Callable
+
+
+# How often (in data rows) read_mac_specific_ip_list reports progress
+_PROGRESS_INTERVAL = 1000
 
 
 class CSVHandler:
@@ -213,7 +217,8 @@ class CSVHandler:
                 
         return ip_list
     
-    def read_mac_specific_ip_list(self, file_path: str) -> Dict[str, str]:
+    def read_mac_specific_ip_list(self, file_path: str,
+                                  progress_callback: Optional[Callable[[int], None]] = None) -> Dict[str, str]:
         """
         Read MAC-specific IP assignment list from CSV file
         
@@ -223,31 +228,88 @@ class CSVHandler:
            192.168.1.101,00408C123456
            192.168.1.102,00408CAABBCC
         
+        Rows are streamed and validated one at a time, so the file is never
+        held in memory as a whole. Row validation stops at the first bad row;
+        duplicates and subnet consistency are checked once all rows are read.
+        
         Args:
             file_path: Path to the CSV file
+            progress_callback: Optional callable receiving the number of rows
+                read so far, invoked every 1000 rows
             
         Returns:
-            Dictionary mapping MAC addresses to IP addresses
+            Dictionary mapping MAC addresses (upper case, no delimiters) to IP addresses
             
         Raises:
             FileNotFoundError: If CSV file doesn't exist
             ValueError: For validation errors or if CSV is not in MAC-specific format
         """
-        # Use the general function but validate it's a MAC-specific format
-        results = self.read_ip_list(file_path)
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
         
-        # Check if the results seem to be in MAC-specific format
-        if not results or not isinstance(results[0], dict) or 'mac' not in results[0]:
-            raise ValueError("CSV file is not in MAC-specific format (missing MAC address column)")
+        ips = []
+        macs = []
         
-        # Convert to a dictionary mapping MACs to IPs
-        mac_to_ip = {}
-        for item in results:
-            mac = item.get('mac', '').upper().replace(':', '').replace('-', '')
-            ip = item.get('ip', '')
-            if mac and ip:
-                mac_to_ip[mac] = ip
+        try:
+            with open(file_path, 'r', newline='', buffering=65536) as csvfile:
+                reader = csv.reader(csvfile)
                 
+                # Locate the IP and MAC columns from the header row
+                headers = [h.strip().lower() for h in next(reader, [])]
+                ip_col = next((headers.index(h) for h in ('finalipaddress', 'ip') if h in headers), None)
+                mac_col = next((headers.index(h) for h in ('macaddress', 'mac') if h in headers), None)
+                if ip_col is None:
+                    raise ValueError("CSV file must contain an 'IP' column")
+                if mac_col is None:
+                    raise ValueError("CSV file is not in MAC-specific format (missing MAC address column)")
+                
+                for row in reader:
+                    if not any(field.strip() for field in row):
+                        continue  # Ignore blank lines
+                    
+                    line = reader.line_num
+                    ip = row[ip_col].strip() if ip_col < len(row) else ''
+                    mac = row[mac_col].strip() if mac_col < len(row) else ''
+                    
+                    try:
+                        ipaddress.IPv4Address(ip)
+                    except ValueError:
+                        raise ValueError(f"Invalid IP address '{ip}' on line {line}")
+                    
+                    if not self._is_valid_mac(mac):
+                        raise ValueError(f"Invalid MAC address '{mac}' on line {line}")
+                    
+                    ips.append(ip)
+                    macs.append(mac.upper().replace(':', '').replace('-', ''))
+                    
+                    if progress_callback and len(ips) % _PROGRESS_INTERVAL == 0:
+                        progress_callback(len(ips))
+        
+        except csv.Error as e:
+            raise ValueError(f"CSV parsing error: {str(e)}")
+        
+        if not ips:
+            raise ValueError("No valid IP assignments found in the CSV file")
+        
+        # Duplicates would cause conflicts during configuration
+        duplicate_ips = self._find_duplicates(ips)
+        if duplicate_ips:
+            dup_list = ', '.join(duplicate_ips)
+            logging.error(f"Duplicate IP addresses in CSV: {dup_list}")
+            raise ValueError(f"Duplicate IP addresses found in CSV: {dup_list}")
+        
+        duplicate_macs = self._find_duplicates(macs)
+        if duplicate_macs:
+            dup_list = ', '.join(duplicate_macs)
+            logging.error(f"Duplicate MAC addresses in CSV: {dup_list}")
+            raise ValueError(f"Duplicate MAC addresses found in CSV: {dup_list}")
+        
+        if not self._verify_ip_subnet_consistency(ips):
+            logging.warning("IP addresses in CSV span multiple subnets - this might cause connectivity issues")
+        
+        mac_to_ip = dict(zip(macs, ips))
+        
+        logging.info(f"Successfully validated and read {len(mac_to_ip)} MAC-to-IP assignments from {file_path}")
         return mac_to_ip
     
     def write_inventory_report(self, file_path: str, camera_data: List[Dict[str, Any]]) -> bool:
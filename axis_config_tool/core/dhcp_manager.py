@@ -184,7 +184,7 @@ class DHCPManager:
         address-already-in-use errors, and network interface problems.
         
         Args:
-            stop_event: Boolean flag to signal stopping the server
+            stop_event: Optional threading.Event that stops the server when set
             
         Raises:
             ValueError: If server configuration is incomplete
@@ -201,6 +201,9 @@ class DHCPManager:
         if not self.interface or not self.server_ip or not self.available_ips:
             raise ValueError("DHCP server not properly configured")
         
+        if stop_event is None:
+            stop_event = threading.Event()
+        
         try:
             # Create and configure the socket
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -223,12 +226,12 @@ class DHCPManager:
             self.is_running = True
             logging.info("DHCP server started")
             
+            # Block in recvfrom with a timeout so the stop_event is checked regularly
+            self.server_socket.settimeout(1.0)
+            
             # Main server loop
-            while not stop_event:
+            while not stop_event.is_set() and self.is_running:
                 try:
-                    # Set a timeout so we can check the stop_event regularly
-                    self.server_socket.settimeout(1.0)
-                    
                     try:
                         data, addr = self.server_socket.recvfrom(4096)
                         self._process_dhcp_packet(data, addr)
@@ -236,6 +239,9 @@ class DHCPManager:
                         # This is expected due to the timeout we set
                         continue
                     except Exception as e:
+                        if not self.is_running:
+                            # stop() closed the socket underneath us
+                            break
                         logging.error(f"Error processing DHCP packet: {e}")
                 
                 except Exception as e:
@@ -8,60 +8,250 @@ Main window implementation
 
 import sys
 import os
+import csv
+from collections import deque
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QGridLayout, QLabel, QCheckBox, 
-                             QLineEdit, QPushButton, QComboBox, QTextEdit, 
+                             QLineEdit, QPushButton, QComboBox, QPlainTextEdit, 
                              QSplitter, QFileDialog, QGroupBox, 
                              QFrame, QSpacerItem, QSizePolicy, QTableWidget,
                              QTableWidgetItem, QHeaderView, QMessageBox, 
                              QApplication, QToolTip)
-from PySide6.QtCore import Qt, Signal, Slot, QSettings, QTimer
-from PySide6.QtGui import QPalette, QIcon, QCursor
+from PySide6.QtCore import Qt, Signal, Slot, QSettings, QTimer, QUrl, QSignalBlocker
+from PySide6.QtGui import QPalette, QIcon, QCursor, QDesktopServices
 
 # Import package modules
-from axis_config_tool.core.dhcp_manager import DHCPManager
-from axis_config_tool.core.camera_discovery import CameraDiscovery
-from axis_config_tool.core.camera_operations import CameraOperations
-from axis_config_tool.core.csv_handler import CSVHandler
-from axis_config_tool.workers.unified_worker import DiscoveryWorker
-from axis_config_tool.gui.about_dialog import AboutDialog
-from axis_config_tool.gui.gui_tour import GUITour
-from axis_config_tool.gui.user_creation_dialog import UserCreationDialog
-from axis_config_tool.gui.dhcp_server_dialog import DHCPServerDialog
-from axis_config_tool.gui.network_config_dialog import NetworkConfigDialog
+from axis_config_tool.workers.unified_worker import DiscoveryWorker, STATUS_SUCCESS
+
+
+# Project root when running from source (three levels above this file)
+_MODULE_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Application icon shipped in the resources package
+_ICON_PATH = os.path.join(_MODULE_ROOT, "axis_config_tool", "resources", "app_icon.ico")
+
+# README locations to try, for development and PyInstaller environments
+_README_CANDIDATES = (
+    os.path.join(_MODULE_ROOT, "README.md"),
+    os.path.join(getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "README.md"),
+)
+
+# Log panel limits: lines kept before the oldest are discarded, and the
+# delay used to coalesce bursts of messages into one document update
+_LOG_MAX_LINES = 5000
+_LOG_FLUSH_INTERVAL_MS = 50
+
+# Setup instructions as a single rich-text table; each "?" link carries its step index
+_SETUP_INSTRUCTION_STEPS = (
+    "<b>Step 1:</b> Manually set your PC's IP address to a static IP on the camera network",
+    "<b>Step 2:</b> Connect your PC directly to the camera(s) with an Ethernet switch",
+    "<b>Step 3:</b> Configure the DHCP server and start it using the buttons below",
+    "<b>Step 4:</b> Power on your cameras and discover them on the network"
+)
+_STEP_HELP_SCHEME = "help://"
+
+# Detailed help shown for each setup step
+_STEP_HELP_TEXTS = (
+    "To set a static IP on Windows:\n1. Open Network Connections\n2. Right-click your network adapter\n" 
+    "3. Select Properties\n4. Select IPv4\n5. Enter a static IP in the same subnet as your cameras",
+    
+    "Use a standard Ethernet switch to connect your PC and all cameras.\n"
+    "Do not connect to your production network during initial setup.",
+    
+    "Open the DHCP server configuration dialog to set up and start a DHCP server.\n"
+    "The DHCP server will provide temporary IP addresses to factory-new cameras.",
+    
+    "Once the DHCP server is running, power on your cameras one at a time.\n"
+    "Wait approximately 30 seconds between powering on each camera.\n"
+    "Then click 'Discover Cameras' to detect them on the network."
+)
+_SETUP_INSTRUCTIONS_HTML = "<table width='100%' cellspacing='4'>{}</table>".format("".join(
+    f"<tr><td width='100%'>{text}</td>"
+    f"<td align='right'><a href='{_STEP_HELP_SCHEME}{i}' title='Click for more information'><b>?</b></a></td></tr>"
+    for i, text in enumerate(_SETUP_INSTRUCTION_STEPS)
+))
+
+# Shared read-only fallback for missing entries in configuration results
+_EMPTY = {}
+
+# Configuration report layout: plain result fields, then per-operation outcome
+# columns as (header, operation key, text used when the operation did not succeed)
+_REPORT_FIELDS = (
+    ("Original IP", 'temp_ip'),
+    ("MAC Address", 'mac'),
+    ("Final IP", 'final_ip'),
+    ("Status", 'status'),
+)
+_REPORT_OPERATIONS = (
+    ("Root Admin", 'root_admin', "Failed"),
+    ("Secondary Admin", 'secondary_admin', "N/A"),
+    ("ONVIF User", 'onvif_user', "N/A"),
+    ("WDR Off", 'wdr_off', "Failed"),
+    ("Replay Protection Off", 'replay_protection_off', "Failed"),
+)
+_REPORT_HEADER = tuple(header for header, _ in _REPORT_FIELDS) + \
+    tuple(header for header, _, _ in _REPORT_OPERATIONS)
+
+
+def _report_row(result):
+    """Flatten one configuration result into a report row"""
+    ops = result.get('operations') or _EMPTY
+    row = [result.get(key, 'N/A') for _, key in _REPORT_FIELDS]
+    row.extend("Success" if ops.get(key, _EMPTY).get('success', False) else fallback
+               for _, key, fallback in _REPORT_OPERATIONS)
+    return row
+
+
+# Fixed parts of the confirmation shown before camera configuration starts
+_CONFIRM_OPS_HEADER = ("The following operations will be performed on each camera:\n"
+                       "1. Set root administrator password")
+_CONFIRM_OP_SECONDARY = "2. Create secondary administrator account"
+_CONFIRM_OP_ONVIF = "3. Create ONVIF user account"
+_CONFIRM_OPS_FIXED = (
+    "4. Turn off WDR (Wide Dynamic Range)",
+    "5. Turn off Replay Attack Protection",
+    "6. Assign final static IP address\n",
+)
+_CONFIRM_FOOTER = "This process may take several minutes. Proceed?"
+
+# Help text for the three-user creation workflow
+_USER_CREATION_HELP_HTML = """<h3>Three-User Creation Workflow</h3>
+<p><b>Step 1: Root Administrator Creation</b><br>
+On factory-new cameras, the first admin user <b>must be named 'root'</b>.<br>
+This is a requirement of Axis OS v10 and will be created without authentication.</p>
+<p><b>Step 2: Secondary Administrator (Optional)</b><br>
+After the root admin is created, you can optionally create a secondary<br>
+administrator with a custom username of your choice.<br>
+This user will have the same password as the root admin.</p>
+<p><b>Step 3: ONVIF User Creation</b><br>
+This user will be specifically for ONVIF client access to the camera.<br>
+It will be created with appropriate ONVIF group permissions.</p>
+<p>The configuration process will then:<br>
+- Turn off WDR (Wide Dynamic Range)<br>
+- Turn off Replay Protection<br>
+- Set the final static IP address<br>
+All these operations will authenticate as the root user.</p>"""
+
+# Status label stylesheets; the label's "state" property selects the look
+_DHCP_STATUS_STYLE = (
+    "QLabel { color: red; font-weight: bold; }"
+    "QLabel[state='ok'] { color: green; }"
+)
+_USER_STATUS_STYLE = (
+    "QLabel { color: #888; font-style: italic; }"
+    "QLabel[state='ok'] { color: green; font-weight: bold; font-style: normal; }"
+)
+_NETWORK_STATUS_STYLE = (
+    "QLabel { color: #888; font-style: italic; }"
+    "QLabel[state='ok'] { color: green; font-style: normal; }"
+    "QLabel[state='warn'] { color: orange; font-style: normal; }"
+)
 
 
 class MainWindow(QMainWindow):
     """Main application window for the Axis Camera Unified Setup & Configuration Tool"""
     
+    # Internal signal used to hand log messages to the GUI thread
+    log_message = Signal(str)
+    
     def __init__(self):
         super().__init__()
         
-        self.dhcp_manager = DHCPManager()
-        self.camera_discovery = CameraDiscovery()
-        self.camera_operations = CameraOperations()
-        self.csv_handler = CSVHandler()
+        # Core managers are created on first use to keep startup light
+        self._dhcp_manager = None
+        self._camera_discovery = None
+        self._camera_operations = None
+        self._csv_handler = None
         
         self.discovered_cameras = []
         self.dhcp_worker = None
         self.discovery_worker = None
+        self.config_worker = None
+        self.config_results = []
+        self.dhcp_dialog = None
+        self.network_dialog = None
+        self._question_boxes = {}
+        
+        # AXIS_NATIVE_DIALOGS=0 selects Qt's own file dialog over the slower-to-open native one
+        self._file_dialog_opts = QFileDialog.Option(0)
+        if os.environ.get("AXIS_NATIVE_DIALOGS") == "0":
+            self._file_dialog_opts |= QFileDialog.DontUseNativeDialog
         self.is_dhcp_running = False
         self.gui_tour = None
+        self._readme_path = None
+        self._sections_built = False
+        self._is_dark = None
+        self._palette_connected = False
+        self._settings = None
+        
+        # User credentials storage
+        self.user_credentials = {
+            "root_password": "",
+            "secondary_username": "",
+            "secondary_password": "",
+            "onvif_username": "",
+            "onvif_password": ""
+        }
+        
+        # Initialize network settings storage
+        self.network_settings = {
+            'subnet_mask': '255.255.255.0',
+            'default_gateway': '',
+            'protocol': 'HTTP',
+            'ip_mode': 'sequential',
+            'csv_path': '',
+            'csv_entries': []
+        }
+        
+        # Pending log lines, flushed to the log panel in batches
+        self._log_buffer = deque()
+        self._log_flush_pending = False
+        self.log_message.connect(self._append_log, Qt.QueuedConnection)
         
         self.init_ui()
         
         # Check if this is the first run to show the tour
         self.check_first_run()
         
+    @property
+    def dhcp_manager(self):
+        """DHCP server manager, created on first access"""
+        if self._dhcp_manager is None:
+            from axis_config_tool.core.dhcp_manager import DHCPManager
+            self._dhcp_manager = DHCPManager()
+        return self._dhcp_manager
+    
+    @property
+    def camera_discovery(self):
+        """Camera discovery helper, created on first access"""
+        if self._camera_discovery is None:
+            from axis_config_tool.core.camera_discovery import CameraDiscovery
+            self._camera_discovery = CameraDiscovery()
+        return self._camera_discovery
+    
+    @property
+    def camera_operations(self):
+        """Camera configuration operations, created on first access"""
+        if self._camera_operations is None:
+            from axis_config_tool.core.camera_operations import CameraOperations
+            self._camera_operations = CameraOperations()
+        return self._camera_operations
+    
+    @property
+    def csv_handler(self):
+        """CSV file handler, created on first access"""
+        if self._csv_handler is None:
+            from axis_config_tool.core.csv_handler import CSVHandler
+            self._csv_handler = CSVHandler()
+        return self._csv_handler
+    
     def init_ui(self):
         """Set up the application's main UI components including layout, menus, and widgets"""
         self.setWindowTitle("AxisAutoConfig v1.0.0")
         self.setMinimumSize(900, 700)
         
-        # Set application icon if available
-        icon_path = os.path.join("axis_config_tool", "resources", "app_icon.ico")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        # Set application icon (QIcon falls back to a null icon if the file is missing)
+        self.setWindowIcon(QIcon(_ICON_PATH))
         
         # Create central widget and main layout
         central_widget = QWidget()
@@ -69,59 +259,90 @@ class MainWindow(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
         
         # Create a horizontal splitter for the top two sections
-        top_splitter = QSplitter(Qt.Horizontal)
+        self._top_splitter = QSplitter(Qt.Horizontal)
         
         # Create a vertical splitter for the bottom sections and to hold the top splitter
-        main_splitter = QSplitter(Qt.Vertical)
-        main_layout.addWidget(main_splitter)
+        self._main_splitter = QSplitter(Qt.Vertical)
+        main_layout.addWidget(self._main_splitter)
         
-        # Create the four main sections
+        # Only the network setup section is needed for the first paint; the
+        # other three start as placeholders and are built by _initialize_sections
         self.network_setup_section = self.create_network_setup_section()
-        self.config_inputs_section = self.create_config_inputs_section()
-        self.log_section = self.create_log_section()
-        self.completion_section = self.create_completion_section()
+        self.config_inputs_section = QWidget()
+        self.log_section = QWidget()
+        self.completion_section = QWidget()
         
         # Add the first two sections to the horizontal splitter
-        top_splitter.addWidget(self.network_setup_section)
-        top_splitter.addWidget(self.config_inputs_section)
+        self._top_splitter.addWidget(self.network_setup_section)
+        self._top_splitter.addWidget(self.config_inputs_section)
         
         # Set equal initial sizes for the top sections
-        top_splitter.setSizes([450, 450])
+        self._top_splitter.setSizes([450, 450])
         
         # Add the horizontal splitter and other sections to the main vertical splitter
-        main_splitter.addWidget(top_splitter)
-        main_splitter.addWidget(self.log_section)
-        main_splitter.addWidget(self.completion_section)
+        self._main_splitter.addWidget(self._top_splitter)
+        self._main_splitter.addWidget(self.log_section)
+        self._main_splitter.addWidget(self.completion_section)
         
         # Set initial sizes for the main splitter
-        main_splitter.setSizes([450, 200, 50])
+        self._main_splitter.setSizes([450, 200, 50])
         
         # Create menu bar
         self.create_menu_bar()
         
-        # Adapt to system theme
-        self.adapt_to_system_theme()
+        # Build the remaining sections once the event loop is running
+        QTimer.singleShot(0, self._initialize_sections)
+    
+    def _initialize_sections(self):
+        """Build the deferred sections and swap them in for their placeholders"""
+        if self._sections_built:
+            return
+        self._sections_built = True
+        
+        top_sizes = self._top_splitter.sizes()
+        main_sizes = self._main_splitter.sizes()
+        
+        self.config_inputs_section = self._replace_placeholder(
+            self._top_splitter, self.config_inputs_section, self.create_config_inputs_section())
+        self.log_section = self._replace_placeholder(
+            self._main_splitter, self.log_section, self.create_log_section())
+        self.completion_section = self._replace_placeholder(
+            self._main_splitter, self.completion_section, self.create_completion_section())
+        
+        self._top_splitter.setSizes(top_sizes)
+        self._main_splitter.setSizes(main_sizes)
+    
+    def _replace_placeholder(self, splitter, placeholder, section):
+        """Replace a placeholder widget in a splitter with the real section"""
+        splitter.replaceWidget(splitter.indexOf(placeholder), section)
+        placeholder.deleteLater()
+        return section
 
+    def _app_settings(self):
+        """Return the application QSettings, creating it on first use"""
+        if self._settings is None:
+            self._settings = QSettings("AxisAutoConfig", "SetupTool")
+        return self._settings
+    
     def check_first_run(self):
         """Check if this is the first application run and show tour if needed"""
-        settings = QSettings("AxisAutoConfig", "SetupTool")
+        settings = self._app_settings()
         first_run = settings.value("FirstRun", True, type=bool)
-        show_tour = settings.value("ShowGUITour", True, type=bool)
         
-        if first_run or show_tour:
-            # Initialize the GUI tour if this is first run
-            if not self.gui_tour:
-                self.gui_tour = GUITour(self)
-            
-            # Show the tour after a short delay to ensure all widgets are properly rendered
-            if first_run:
-                settings.setValue("FirstRun", False)
-                # Start the tour after the window appears
-                QTimer.singleShot(500, self.start_gui_tour)
+        # Show the tour after a short delay to ensure all widgets are properly rendered;
+        # start_gui_tour builds the tour itself, so nothing is created up front
+        if first_run:
+            settings.setValue("FirstRun", False)
+            # Start the tour after the window appears
+            QTimer.singleShot(500, self.start_gui_tour)
                 
+    @Slot()
     def start_gui_tour(self):
         """Start the GUI tour"""
+        # The tour highlights every section, so make sure they all exist
+        self._initialize_sections()
         if not self.gui_tour:
+            from axis_config_tool.gui.gui_tour import GUITour
             self.gui_tour = GUITour(self)
         self.gui_tour.start_tour()
     
@@ -133,29 +354,13 @@ class MainWindow(QMainWindow):
         # Instructions panel at the top
         instructions = QGroupBox("Setup Instructions")
         instructions_layout = QVBoxLayout(instructions)
-        instruction_steps = [
-            "<b>Step 1:</b> Manually set your PC's IP address to a static IP on the camera network",
-            "<b>Step 2:</b> Connect your PC directly to the camera(s) with an Ethernet switch",
-            "<b>Step 3:</b> Configure the DHCP server and start it using the buttons below",
-            "<b>Step 4:</b> Power on your cameras and discover them on the network"
-        ]
         
-        for i, instruction in enumerate(instruction_steps):
-            step_layout = QHBoxLayout()
-            
-            # Instruction text
-            label = QLabel(instruction)
-            label.setTextFormat(Qt.RichText)
-            step_layout.addWidget(label, 1)
-            
-            # Help button with question mark
-            help_btn = QPushButton("?")
-            help_btn.setFixedSize(20, 20)
-            help_btn.setToolTip("Click for more information")
-            help_btn.clicked.connect(lambda checked, step=i: self.show_step_help(step))
-            step_layout.addWidget(help_btn, 0)
-            
-            instructions_layout.addLayout(step_layout)
+        # One label renders every step; its "?" links open the step help
+        steps_label = QLabel(_SETUP_INSTRUCTIONS_HTML)
+        steps_label.setTextFormat(Qt.RichText)
+        steps_label.setTextInteractionFlags(Qt.LinksAccessibleByMouse)
+        steps_label.linkActivated.connect(self._on_step_help_link)
+        instructions_layout.addWidget(steps_label)
         
         layout.addWidget(instructions)
         
@@ -194,7 +399,7 @@ class MainWindow(QMainWindow):
         # Status label
         dhcp_control_layout.addWidget(QLabel("Status:"))
         self.dhcp_status_label = QLabel("Stopped")
-        self.dhcp_status_label.setStyleSheet("color: red; font-weight: bold;")
+        self.dhcp_status_label.setStyleSheet(_DHCP_STATUS_STYLE)
         dhcp_control_layout.addWidget(self.dhcp_status_label)
         
         # Add stretch to push everything to the left
@@ -228,7 +433,7 @@ class MainWindow(QMainWindow):
         # Discovered Cameras Table
         self.cameras_table = QTableWidget(0, 2)
         self.cameras_table.setHorizontalHeaderLabels(["Temporary DHCP IP", "MAC Address"])
-        self.cameras_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Columns stay Interactive while rows arrive; discovery_completed stretches them
         discovery_layout.addWidget(self.cameras_table)
         
         layout.addWidget(discovery_group)
@@ -259,15 +464,6 @@ class MainWindow(QMainWindow):
         user_summary.setWordWrap(True)
         user_layout.addWidget(user_summary)
         
-        # User credentials storage
-        self.user_credentials = {
-            "root_password": "",
-            "secondary_username": "",
-            "secondary_password": "",
-            "onvif_username": "",
-            "onvif_password": ""
-        }
-        
         # Button to open the user creation dialog
         user_dialog_btn = QPushButton("Configure User Creation Settings")
         user_dialog_btn.clicked.connect(self.configure_user_settings)
@@ -275,7 +471,7 @@ class MainWindow(QMainWindow):
         
         # Status label to show configuration status
         self.user_config_status = QLabel("Not configured yet")
-        self.user_config_status.setStyleSheet("color: #888; font-style: italic;")
+        self.user_config_status.setStyleSheet(_USER_STATUS_STYLE)
         user_layout.addWidget(self.user_config_status)
         
         # Add completed user group to main config layout
@@ -295,21 +491,11 @@ class MainWindow(QMainWindow):
         
         # Status indicator
         self.network_config_status = QLabel("Not configured")
-        self.network_config_status.setStyleSheet("color: #888; font-style: italic;")
+        self.network_config_status.setStyleSheet(_NETWORK_STATUS_STYLE)
         network_btn_layout.addWidget(self.network_config_status, 1)
         
         net_layout.addLayout(network_btn_layout)
         
-        # Initialize network settings storage
-        self.network_settings = {
-            'subnet_mask': '255.255.255.0',
-            'default_gateway': '',
-            'protocol': 'HTTP',
-            'ip_mode': 'sequential',
-            'csv_path': '',
-            'csv_entries': []
-        }
-        
         # Add the network group to the main config layout
         config_layout.addWidget(net_group, row, 0, 1, 2)
         row += 1
@@ -340,8 +526,11 @@ class MainWindow(QMainWindow):
         section = QGroupBox("Pre-Configuration Process & Real-time Log")
         layout = QVBoxLayout(section)
         
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        # Let Qt discard the oldest lines so long sessions don't grow unbounded
+        self.log_text.setMaximumBlockCount(_LOG_MAX_LINES)
         layout.addWidget(self.log_text)
         
         return section
@@ -389,10 +578,29 @@ class MainWindow(QMainWindow):
         about_action = help_menu.addAction("About")
         about_action.triggered.connect(self.show_about)
     
+    def showEvent(self, event):
+        """Start following the system theme once the window is first shown"""
+        super().showEvent(event)
+        if not self._palette_connected:
+            self._palette_connected = True
+            QApplication.instance().paletteChanged.connect(self._on_palette_changed)
+            # Detect the initial theme after the first paint has been delivered
+            QTimer.singleShot(0, self._on_palette_changed)
+    
+    @Slot()
+    def _on_palette_changed(self, *args):
+        """Re-evaluate the system theme when the application palette changes"""
+        self.adapt_to_system_theme()
+    
     def adapt_to_system_theme(self):
         """Adapt the application to the system theme (light/dark)"""
         app = QApplication.instance()
-        if app.palette().color(QPalette.Window).lightness() < 128:
+        is_dark = app.palette().color(QPalette.Window).lightness() < 128
+        if is_dark == self._is_dark:
+            return
+        self._is_dark = is_dark
+        
+        if is_dark:
             # Dark mode detected
             self.log("System dark theme detected and applied")
         else:
@@ -404,7 +612,8 @@ class MainWindow(QMainWindow):
         """Open the DHCP server configuration dialog"""
         
         # If dialog doesn't exist yet, create it
-        if not hasattr(self, 'dhcp_dialog') or self.dhcp_dialog is None:
+        if self.dhcp_dialog is None:
+            from axis_config_tool.gui.dhcp_server_dialog import DHCPServerDialog
             self.dhcp_dialog = DHCPServerDialog(self.dhcp_manager, self)
             
             # Connect signals from the dialog
@@ -416,6 +625,7 @@ class MainWindow(QMainWindow):
         self.dhcp_dialog.raise_()
         self.dhcp_dialog.activateWindow()
     
+    @Slot(dict)
     def on_dhcp_configuration_updated(self, config):
         """Handle DHCP configuration updated signal from dialog"""
         self.log(f"DHCP server configured successfully for interface {config['interface']}")
@@ -426,7 +636,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def start_dhcp_server(self):
         """Start the DHCP server"""
-        if not hasattr(self, 'dhcp_dialog') or self.dhcp_dialog is None:
+        if self.dhcp_dialog is None:
             QMessageBox.warning(self, "Configuration Required", "Please configure the DHCP server first.")
             self.open_dhcp_server_dialog()
             return
@@ -460,7 +670,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def stop_dhcp_server(self):
         """Stop the DHCP server"""
-        if hasattr(self, 'dhcp_worker') and self.dhcp_worker and self.is_dhcp_running:
+        if self.dhcp_worker and self.is_dhcp_running:
             try:
                 # Signal worker to stop
                 self.dhcp_worker.stop()
@@ -485,12 +695,12 @@ class MainWindow(QMainWindow):
         """Update the DHCP server status label"""
         self.dhcp_status_label.setText(status)
         if status == "Running":
-            self.dhcp_status_label.setStyleSheet("color: green; font-weight: bold;")
+            self._set_status_state(self.dhcp_status_label, "ok")
             # Enable camera discovery buttons
             self.discover_cameras_btn.setEnabled(True)
             self.refresh_discovery_btn.setEnabled(True)
         else:
-            self.dhcp_status_label.setStyleSheet("color: red; font-weight: bold;")
+            self._set_status_state(self.dhcp_status_label, "")
     
     @Slot()
     def discover_cameras(self):
@@ -501,19 +711,21 @@ class MainWindow(QMainWindow):
             
         # Clear previous results
         self.cameras_table.setRowCount(0)
+        self.cameras_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.discovered_cameras = []
         
         # Start discovery in worker thread
         try:
             # Get leases from DHCP manager via the dialog
-            if hasattr(self, 'dhcp_dialog') and self.dhcp_dialog is not None:
+            if self.dhcp_dialog is not None:
                 leases = self.dhcp_manager.get_active_leases()
                 
                 self.discovery_worker = DiscoveryWorker(
                     self.camera_discovery, 
                     leases
                 )
-                self.discovery_worker.camera_found.connect(self.add_discovered_camera)
+                self.discovery_worker.cameras_batch.connect(
+                    self.add_discovered_cameras, Qt.QueuedConnection)
                 self.discovery_worker.log_message.connect(self.log)
                 self.discovery_worker.finished.connect(self.discovery_completed)
                 
@@ -529,25 +741,43 @@ class MainWindow(QMainWindow):
             self.log(f"Error during camera discovery: {str(e)}")
             self.discover_cameras_btn.setEnabled(True)
     
-    @Slot(str, str)
-    def add_discovered_camera(self, ip, mac):
-        """Add a discovered camera to the table"""
-        row = self.cameras_table.rowCount()
-        self.cameras_table.insertRow(row)
-        self.cameras_table.setItem(row, 0, QTableWidgetItem(ip))
-        self.cameras_table.setItem(row, 1, QTableWidgetItem(mac))
-        
-        self.discovered_cameras.append({"ip": ip, "mac": mac})
-        self.log(f"Discovered camera: IP {ip}, MAC {mac}")
+    @Slot(list)
+    def add_discovered_cameras(self, batch):
+        """Add a batch of discovered (IP, MAC) cameras to the table in one pass"""
+        table = self.cameras_table
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        try:
+            row = table.rowCount()
+            table.setRowCount(row + len(batch))
+            for ip, mac in batch:
+                table.setItem(row, 0, QTableWidgetItem(ip))
+                table.setItem(row, 1, QTableWidgetItem(mac))
+                row += 1
+        finally:
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
+            table.viewport().update()
+        
+        for ip, mac in batch:
+            self.discovered_cameras.append({"ip": ip, "mac": mac})
+            self.log(f"Discovered camera: IP {ip}, MAC {mac}")
     
     @Slot()
     def discovery_completed(self):
         """Called when camera discovery is complete"""
+        # Size the columns once now that every row is in place
+        header = self.cameras_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.cameras_table.resizeColumnsToContents()
+        header.setSectionResizeMode(QHeaderView.Stretch)
+        
         self.discover_cameras_btn.setEnabled(True)
         self.log(f"Camera discovery completed. Found {len(self.discovered_cameras)} potential Axis camera(s).")
         
         # Enable start config button if we have cameras and a CSV
-        if len(self.discovered_cameras) > 0 and hasattr(self, 'csv_path_label') and os.path.exists(self.csv_path_label.text()):
+        if self.discovered_cameras and self.network_settings.get('csv_entries'):
             self.start_config_btn.setEnabled(True)
             
         # Re-enable discovery buttons
@@ -559,31 +789,49 @@ class MainWindow(QMainWindow):
         """Open the network configuration dialog"""
         
         # If dialog doesn't exist yet, create it
-        dialog = NetworkConfigDialog(self.csv_handler, self)
+        if self.network_dialog is None:
+            from axis_config_tool.gui.network_config_dialog import NetworkConfigDialog
+            self.network_dialog = NetworkConfigDialog(self.csv_handler, self)
             
-        # Connect signals from the dialog
-        dialog.settings_updated.connect(self.update_network_settings)
-        dialog.log_message.connect(self.log)
-        
-        # Initialize dialog with current settings
-        if self.network_settings.get('csv_path'):
-            dialog.csv_path = self.network_settings.get('csv_path')
+            # Connect signals from the dialog
+            self.network_dialog.settings_updated.connect(self.update_network_settings)
+            self.network_dialog.log_message.connect(self.log)
+        dialog = self.network_dialog
+        
+        # Refresh the dialog with the current settings, discarding any cancelled edits
+        dialog.csv_path = self.network_settings.get('csv_path', '')
+        dialog.csv_entries = self.network_settings.get('csv_entries', [])
+        if dialog.csv_path:
             dialog.csv_path_label.setText(os.path.basename(dialog.csv_path))
-        
-        dialog.subnet_mask.setText(self.network_settings.get('subnet_mask', '255.255.255.0'))
-        dialog.default_gateway.setText(self.network_settings.get('default_gateway', ''))
-        
-        # Set the protocol
-        protocol_idx = 0  # Default to HTTP
-        if self.network_settings.get('protocol') == 'HTTPS':
-            protocol_idx = 1
-        dialog.vapix_protocol.setCurrentIndex(protocol_idx)
-        
-        # Set the IP assignment mode
-        if self.network_settings.get('ip_mode') == 'mac_specific':
-            dialog.mac_specific_radio.setChecked(True)
         else:
-            dialog.sequential_radio.setChecked(True)
+            # No CSV loaded; drop any file name or status left from a cancelled load
+            dialog.csv_path_label.setText("No CSV file loaded")
+            dialog.csv_status_label.setText("")
+            dialog.csv_status_label.setStyleSheet("")
+        
+        # Populate the fields with their signals blocked, then refresh dependent text once
+        blockers = [QSignalBlocker(widget) for widget in (
+            dialog.subnet_mask, dialog.default_gateway, dialog.vapix_protocol,
+            dialog.sequential_radio, dialog.mac_specific_radio)]
+        try:
+            dialog.subnet_mask.setText(self.network_settings.get('subnet_mask', '255.255.255.0'))
+            dialog.default_gateway.setText(self.network_settings.get('default_gateway', ''))
+            
+            # Set the protocol
+            protocol_idx = 0  # Default to HTTP
+            if self.network_settings.get('protocol') == 'HTTPS':
+                protocol_idx = 1
+            dialog.vapix_protocol.setCurrentIndex(protocol_idx)
+            
+            # Set the IP assignment mode
+            if self.network_settings.get('ip_mode') == 'mac_specific':
+                dialog.mac_specific_radio.setChecked(True)
+            else:
+                dialog.sequential_radio.setChecked(True)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        dialog.update_mode_description()
         
         # Show the dialog
         if dialog.exec():
@@ -591,6 +839,22 @@ class MainWindow(QMainWindow):
         else:
             self.log("Network configuration cancelled")
     
+    def _ask_question(self, title, text):
+        """Ask a Yes/No question, reusing one message box per title; True if Yes was chosen"""
+        box = self._question_boxes.get(title)
+        if box is None:
+            box = QMessageBox(QMessageBox.Question, title, "", QMessageBox.Yes | QMessageBox.No, self)
+            self._question_boxes[title] = box
+        box.setText(text)
+        box.exec()
+        return box.standardButton(box.clickedButton()) == QMessageBox.Yes
+    
+    def _set_status_state(self, label, state):
+        """Switch a status label to one of the states in its stylesheet without reparsing it"""
+        label.setProperty("state", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
     @Slot(dict)
     def update_network_settings(self, settings):
         """Update network settings from the dialog"""
@@ -606,52 +870,38 @@ class MainWindow(QMainWindow):
                 f"✓ {entries_count} IPs loaded from {csv_filename} | " 
                 f"Mode: {settings.get('ip_mode', 'sequential').title()}"
             )
-            self.network_config_status.setStyleSheet("color: green; font-weight: normal;")
+            self._set_status_state(self.network_config_status, "ok")
             
             # Enable start config button if we have cameras
             if len(self.discovered_cameras) > 0:
                 self.start_config_btn.setEnabled(True)
         else:
             self.network_config_status.setText("⚠ No CSV file loaded")
-            self.network_config_status.setStyleSheet("color: orange; font-weight: normal;")
+            self._set_status_state(self.network_config_status, "warn")
     
+    @Slot(int)
     def show_step_help(self, step):
         """Show detailed help for a specific setup step as a tooltip"""
-        help_texts = [
-            "To set a static IP on Windows:\n1. Open Network Connections\n2. Right-click your network adapter\n" 
-            "3. Select Properties\n4. Select IPv4\n5. Enter a static IP in the same subnet as your cameras",
-            
-            "Use a standard Ethernet switch to connect your PC and all cameras.\n"
-            "Do not connect to your production network during initial setup.",
-            
-            "Open the DHCP server configuration dialog to set up and start a DHCP server.\n"
-            "The DHCP server will provide temporary IP addresses to factory-new cameras.",
-            
-            "Once the DHCP server is running, power on your cameras one at a time.\n"
-            "Wait approximately 30 seconds between powering on each camera.\n"
-            "Then click 'Discover Cameras' to detect them on the network."
-        ]
-        
-        # Get the global position of the button that was clicked
-        btn = self.sender()
-        if btn:
-            global_pos = btn.mapToGlobal(btn.rect().topRight())
-            # Show the tooltip slightly offset from the button
-            QToolTip.showText(global_pos, help_texts[step], btn)
-        else:
-            # Fallback to cursor position if sender not found
-            QToolTip.showText(QCursor.pos(), help_texts[step], self)
-        
+        # Show the tooltip next to the link that was clicked
+        QToolTip.showText(QCursor.pos(), _STEP_HELP_TEXTS[step], self)
+    
+    @Slot(str)
+    def _on_step_help_link(self, link):
+        """Dispatch a help:// link from the setup instructions to show_step_help"""
+        if link.startswith(_STEP_HELP_SCHEME):
+            self.show_step_help(int(link[len(_STEP_HELP_SCHEME):]))
     
     @Slot()
     def show_about(self):
         """Show the about dialog"""
+        from axis_config_tool.gui.about_dialog import AboutDialog
         dialog = AboutDialog(self)
         dialog.exec()
         
     @Slot()
     def configure_user_settings(self):
         """Open the user creation settings dialog"""
+        from axis_config_tool.gui.user_creation_dialog import UserCreationDialog
         dialog = UserCreationDialog(self)
         
         # Pre-populate dialog with any existing values
@@ -671,14 +921,14 @@ class MainWindow(QMainWindow):
             self.user_credentials = credentials
             
             # Update status label
-            status_text = "Configured: Root admin"
+            parts = ["Configured: Root admin"]
             if credentials["secondary_username"]:
-                status_text += f", Secondary admin ({credentials['secondary_username']})"
+                parts.append(f"Secondary admin ({credentials['secondary_username']})")
             if credentials["onvif_username"]:
-                status_text += f", ONVIF user ({credentials['onvif_username']})"
+                parts.append(f"ONVIF user ({credentials['onvif_username']})")
             
-            self.user_config_status.setText(status_text)
-            self.user_config_status.setStyleSheet("color: green; font-weight: bold;")
+            self._set_status_state(self.user_config_status, "ok")
+            self.user_config_status.setText(", ".join(parts))
             
             self.log("User creation settings configured successfully")
         else:
@@ -688,56 +938,53 @@ class MainWindow(QMainWindow):
     @Slot()
     def show_user_creation_help(self):
         """Show help about the three-user creation workflow"""
-        help_text = (
-            "<h3>Three-User Creation Workflow</h3>"
-            "<p><b>Step 1: Root Administrator Creation</b><br>"
-            "On factory-new cameras, the first admin user <b>must be named 'root'</b>.<br>"
-            "This is a requirement of Axis OS v10 and will be created without authentication.</p>"
-            
-            "<p><b>Step 2: Secondary Administrator (Optional)</b><br>"
-            "After the root admin is created, you can optionally create a secondary<br>"
-            "administrator with a custom username of your choice.<br>"
-            "This user will have the same password as the root admin.</p>"
-            
-            "<p><b>Step 3: ONVIF User Creation</b><br>"
-            "This user will be specifically for ONVIF client access to the camera.<br>"
-            "It will be created with appropriate ONVIF group permissions.</p>"
-            
-            "<p>The configuration process will then:<br>"
-            "- Turn off WDR (Wide Dynamic Range)<br>"
-            "- Turn off Replay Protection<br>"
-            "- Set the final static IP address<br>"
-            "All these operations will authenticate as the root user.</p>"
-        )
-        
-        QMessageBox.information(self, "User Creation Workflow Help", help_text)
+        QMessageBox.information(self, "User Creation Workflow Help", _USER_CREATION_HELP_HTML)
     
     
     @Slot()
     def view_documentation(self):
         """Open the README.md file in the default text editor or browser"""
-        readme_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "README.md")
+        # Resolve the README location once and reuse it on later calls
+        if not self._readme_path:
+            self._readme_path = next(
+                (path for path in _README_CANDIDATES if os.path.exists(path)), None)
         
-        # Handle both development and PyInstaller environments
-        if not os.path.exists(readme_path):
-            # If bundled with PyInstaller
-            base_path = getattr(sys, '_MEIPASS', os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
-            readme_path = os.path.join(base_path, "README.md")
-        
-        if os.path.exists(readme_path):
+        if self._readme_path:
             # Open README with default application
-            if sys.platform == 'win32':
-                os.startfile(readme_path)
-            else:
-                import subprocess
-                subprocess.call(('xdg-open', readme_path))
+            QDesktopServices.openUrl(QUrl.fromLocalFile(self._readme_path))
         else:
             QMessageBox.warning(self, "Documentation Not Found",
                              "README.md file could not be located.")
     
+    @Slot(str)
     def log(self, message):
         """Display a message in the application log panel"""
-        self.log_text.append(f"{message}")
+        # Always touch the widget from the GUI thread, whichever thread logs
+        self.log_message.emit(message)
+    
+    @Slot(str)
+    def _append_log(self, message):
+        """Buffer a log message and coalesce bursts into a single widget update"""
+        self._append_log_lines([message])
+    
+    @Slot(list)
+    def _append_log_lines(self, lines):
+        """Buffer a batch of log messages sent by a worker thread"""
+        self._log_buffer.extend(lines)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(_LOG_FLUSH_INTERVAL_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Append all buffered log messages to the log panel in one update"""
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+        # Messages logged during startup can arrive before the log panel exists
+        self._initialize_sections()
+        batched = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        self.log_text.appendPlainText(batched)
     
     @Slot()
     def start_camera_configuration(self):
@@ -783,60 +1030,40 @@ class MainWindow(QMainWindow):
         config_params['protocol'] = self.network_settings.get('protocol', 'HTTP')
         config_params['ip_mode'] = self.network_settings.get('ip_mode', 'sequential')
         
-        # IP list from network settings
-        if config_params['ip_mode'] == 'sequential':
-            # For sequential mode, entries should be a list of IPs
-            config_params['ip_list'] = self.network_settings.get('csv_entries', [])
-        else:
-            # For MAC-specific mode, entries should already be a dictionary
-            config_params['ip_list'] = self.network_settings.get('csv_entries', {})
+        # IP list from network settings: a tuple of IPs in sequential mode, or a
+        # tuple of (mac, ip) pairs in MAC-specific mode; passed through unchanged
+        config_params['ip_list'] = self.network_settings.get('csv_entries', ())
         
         # Confirm with the user
         camera_count = len(self.discovered_cameras)
         ip_count = len(config_params['ip_list'])
         
-        confirm_msg = (
-            f"Ready to configure {camera_count} camera(s) with the following settings:\n\n"
-            f"- Root Administrator Password: {'*'*len(config_params['admin_pass'])}\n"
-        )
-        
+        lines = [
+            f"Ready to configure {camera_count} camera(s) with the following settings:\n",
+            f"- Root Administrator Password: {'*'*len(config_params['admin_pass'])}",
+        ]
         if config_params['secondary_username']:
-            confirm_msg += f"- Secondary Administrator: {config_params['secondary_username']}\n"
-        
+            lines.append(f"- Secondary Administrator: {config_params['secondary_username']}")
         if config_params['onvif_user']:
-            confirm_msg += f"- ONVIF User: {config_params['onvif_user']}\n"
-            
-        confirm_msg += (
-            f"- Subnet Mask: {config_params['subnet_mask']}\n"
-            f"- Default Gateway: {config_params['gateway'] or 'None'}\n"
-            f"- Protocol: {config_params['protocol']}\n"
-            f"- IP Assignment Mode: {config_params['ip_mode'].title()}\n"
-            f"- Available IPs in CSV: {ip_count}\n\n"
-            "The following operations will be performed on each camera:\n"
-            "1. Set root administrator password\n"
-        )
-        
+            lines.append(f"- ONVIF User: {config_params['onvif_user']}")
+        lines.extend((
+            f"- Subnet Mask: {config_params['subnet_mask']}",
+            f"- Default Gateway: {config_params['gateway'] or 'None'}",
+            f"- Protocol: {config_params['protocol']}",
+            f"- IP Assignment Mode: {config_params['ip_mode'].title()}",
+            f"- Available IPs in CSV: {ip_count}\n",
+        ))
+        
+        lines.append(_CONFIRM_OPS_HEADER)
         if config_params['secondary_username']:
-            confirm_msg += "2. Create secondary administrator account\n"
-            
+            lines.append(_CONFIRM_OP_SECONDARY)
         if config_params['onvif_user']:
-            confirm_msg += "3. Create ONVIF user account\n"
-            
-        confirm_msg += (
-            "4. Turn off WDR (Wide Dynamic Range)\n"
-            "5. Turn off Replay Attack Protection\n"
-            "6. Assign final static IP address\n\n"
-            "This process may take several minutes. Proceed?"
-        )
-        
-        reply = QMessageBox.question(
-            self, 
-            "Confirm Camera Configuration",
-            confirm_msg,
-            QMessageBox.Yes | QMessageBox.No
-        )
+            lines.append(_CONFIRM_OP_ONVIF)
+        lines.extend(_CONFIRM_OPS_FIXED)
+        lines.append(_CONFIRM_FOOTER)
+        confirm_msg = "\n".join(lines)
         
-        if reply == QMessageBox.No:
+        if not self._ask_question("Confirm Camera Configuration", confirm_msg):
             return
             
         # Disable configuration button during the process
@@ -856,8 +1083,10 @@ class MainWindow(QMainWindow):
         
         # Connect signals
         self.config_worker.log_message.connect(self.log)
+        self.config_worker.log_batch.connect(self._append_log_lines)
         self.config_worker.progress_update.connect(self.update_config_progress)
         self.config_worker.camera_configured.connect(self.on_camera_configured)
+        self.config_worker.camera_configured_batch.connect(self.on_cameras_configured)
         self.config_worker.configuration_complete.connect(self.on_configuration_complete)
         
         # Start the worker
@@ -871,13 +1100,15 @@ class MainWindow(QMainWindow):
     
     @Slot(str, bool, dict)
     def on_camera_configured(self, ip, success, details):
-        """Handle completion of configuration for a single camera"""
-        if success:
-            self.log(f"Camera at {ip} successfully configured")
-        else:
-            temp_ip = details.get('temp_ip', ip)
-            status = details.get('status', 'Unknown Error')
-            self.log(f"Camera at {temp_ip} failed: {status}")
+        """Handle a camera that failed to configure (successes arrive in batches)"""
+        temp_ip = details.get('temp_ip', ip)
+        status = details.get('status', 'Unknown Error')
+        self.log(f"Camera at {temp_ip} failed: {status}")
+    
+    @Slot(list)
+    def on_cameras_configured(self, batch):
+        """Handle a batch of successfully configured cameras with a single log update"""
+        self.log("\n".join(f"Camera at {ip} successfully configured" for ip, _ in batch))
     
     @Slot(list)
     def on_configuration_complete(self, results):
@@ -886,8 +1117,8 @@ class MainWindow(QMainWindow):
         self.start_config_btn.setEnabled(True)
         
         # Calculate success/failure statistics
-        success_count = len([r for r in results if r.get('status') == 'Success'])
         total_count = len(results)
+        success_count = sum(1 for r in results if r.get('status') == STATUS_SUCCESS)
         
         # Update result summary
         self.result_summary_label.setText(
@@ -918,7 +1149,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def save_configuration_report(self):
         """Save a CSV report of the configuration results"""
-        if not hasattr(self, 'config_results') or not self.config_results:
+        if not self.config_results:
             QMessageBox.warning(self, "No Data", "No configuration results to save.")
             return
             
@@ -927,34 +1158,19 @@ class MainWindow(QMainWindow):
             self,
             "Save Configuration Report",
             "camera_configuration_report.csv",
-            "CSV Files (*.csv)"
+            "CSV Files (*.csv)",
+            options=self._file_dialog_opts
         )
         
         if not file_path:
             return
             
         try:
-            # Generate CSV content
-            csv_content = "Original IP,MAC Address,Final IP,Status,Root Admin,Secondary Admin,ONVIF User,WDR Off,Replay Protection Off\n"
-            
-            for result in self.config_results:
-                temp_ip = result.get('temp_ip', 'N/A')
-                mac = result.get('mac', 'N/A')
-                final_ip = result.get('final_ip', 'N/A')
-                status = result.get('status', 'N/A')
-                
-                operations = result.get('operations', {})
-                root_admin = "Success" if operations.get('root_admin', {}).get('success', False) else "Failed"
-                secondary_admin = "Success" if operations.get('secondary_admin', {}).get('success', False) else "N/A"
-                onvif_user = "Success" if operations.get('onvif_user', {}).get('success', False) else "N/A"
-                wdr_off = "Success" if operations.get('wdr_off', {}).get('success', False) else "Failed"
-                replay_off = "Success" if operations.get('replay_protection_off', {}).get('success', False) else "Failed"
-                
-                csv_content += f"{temp_ip},{mac},{final_ip},{status},{root_admin},{secondary_admin},{onvif_user},{wdr_off},{replay_off}\n"
-                
-            # Write to file
-            with open(file_path, 'w') as f:
-                f.write(csv_content)
+            # Stream rows straight to the file through a large write buffer
+            with open(file_path, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                writer.writerow(_REPORT_HEADER)
+                writer.writerows(_report_row(result) for result in self.config_results)
                 
             self.log(f"Configuration report saved to {file_path}")
             
@@ -967,11 +1183,8 @@ class MainWindow(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                if sys.platform == 'win32':
-                    os.startfile(file_path)
-                else:
-                    import subprocess
-                    subprocess.call(('xdg-open', file_path))
+                # Hand off to the platform's default application without blocking the GUI
+                QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
                     
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Error saving report: {str(e)}")
@@ -984,21 +1197,19 @@ class MainWindow(QMainWindow):
             self.stop_dhcp_server()
         
         # If configuration is in progress, ask before closing
-        if hasattr(self, 'config_worker') and self.config_worker and self.config_worker.isRunning():
-            reply = QMessageBox.question(
-                self,
+        if self.config_worker and self.config_worker.isRunning():
+            if self._ask_question(
                 "Configuration In Progress",
                 "Camera configuration is still in progress. Closing now will interrupt the process. "
-                "Are you sure you want to close?",
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
+                "Are you sure you want to close?"
+            ):
                 # Stop the worker gracefully
                 self.config_worker.stop()
                 self.config_worker.wait()
             else:
                 event.ignore()
                 return
-            
+        
+        # Make sure any pending log messages are written out
+        self._flush_log()
         event.accept()
@@ -10,13 +10,33 @@ for camera static IP assignment including subnet mask, default gateway,
 VAPIX protocol selection, and IP assignment mode.
 """
 
+import csv
 import logging
 import os
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
                              QLabel, QLineEdit, QPushButton, QComboBox, QRadioButton,
                              QMessageBox, QGroupBox, QFrame, QSizePolicy, QDialogButtonBox,
                              QSpacerItem, QTabWidget, QWidget, QTextEdit, QFileDialog)
-from PySide6.QtCore import Qt, Signal, Slot, QSettings
+from PySide6.QtCore import Qt, Signal, Slot, QSettings, QCoreApplication, QEventLoop
+
+
+# CSV templates offered for download, keyed by template type:
+# (rows, default file name)
+_SEQ_TEMPLATE = (
+    ("FinalIPAddress",),
+    ("192.168.1.101",),
+    ("192.168.1.102",),
+    ("192.168.1.103",),
+)
+_MAC_TEMPLATE = (
+    ("FinalIPAddress", "MACAddress"),
+    ("192.168.1.101", "00408C123456"),
+    ("192.168.1.102", "00408CAABBCC"),
+)
+_CSV_TEMPLATES = {
+    "sequential": (_SEQ_TEMPLATE, "sequential_ip_template.csv"),
+    "mac_specific": (_MAC_TEMPLATE, "mac_specific_ip_template.csv")
+}
 
 
 class NetworkConfigDialog(QDialog):
@@ -33,6 +53,12 @@ class NetworkConfigDialog(QDialog):
         self.csv_handler = csv_handler
         self.csv_path = ""
         self.csv_entries = []
+        self._settings = QSettings("AxisAutoConfig", "SetupTool")
+        
+        # AXIS_NATIVE_DIALOGS=0 selects Qt's own file dialog over the slower-to-open native one
+        self._file_dialog_opts = QFileDialog.Option(0)
+        if os.environ.get("AXIS_NATIVE_DIALOGS") == "0":
+            self._file_dialog_opts |= QFileDialog.DontUseNativeDialog
         
         self.setWindowTitle("Network Configuration Settings")
         self.setMinimumWidth(600)
@@ -81,7 +107,7 @@ class NetworkConfigDialog(QDialog):
     def load_default_settings(self):
         """Load previously saved default settings if available"""
         try:
-            settings = QSettings("AxisAutoConfig", "SetupTool")
+            settings = self._settings
             
             # Load basic network settings
             subnet_mask = settings.value("DefaultSubnetMask", "255.255.255.0")
@@ -314,7 +340,8 @@ class NetworkConfigDialog(QDialog):
         mode = "mac_specific" if is_mac_specific else "sequential"
         
         # Ask user for file
-        file_path, _ = QFileDialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Open CSV File", "", "CSV Files (*.csv)",
+                                                   options=self._file_dialog_opts)
         
         if not file_path:
             return  # User cancelled
@@ -322,7 +349,8 @@ class NetworkConfigDialog(QDialog):
         try:
             # Load and validate the CSV
             if is_mac_specific:
-                result = self.csv_handler.read_mac_specific_ip_list(file_path)
+                result = self.csv_handler.read_mac_specific_ip_list(
+                    file_path, progress_callback=self._show_csv_progress)
                 # Result will be a dictionary mapping MAC addresses to IPs
                 entry_count = len(result)
                 
@@ -365,28 +393,37 @@ class NetworkConfigDialog(QDialog):
             self.csv_status_label.setText(f"✗ CSV validation failed: {str(e)}")
             self.csv_status_label.setStyleSheet("color: red;")
     
+    def _show_csv_progress(self, row_count):
+        """Show how many rows of a large CSV have been validated so far"""
+        self.csv_status_label.setText(f"Validating CSV... {row_count} rows read")
+        # The read runs on this thread, so let the label repaint without taking user input
+        QCoreApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
+    
     @Slot()
     def save_csv_template(self, template_type):
         """Save a CSV template based on the template type"""
-        if template_type == "sequential":
-            template_content = "FinalIPAddress\n192.168.1.101\n192.168.1.102\n192.168.1.103"
-            default_filename = "sequential_ip_template.csv"
-        else:  # MAC-specific
-            template_content = "FinalIPAddress,MACAddress\n192.168.1.101,00408C123456\n192.168.1.102,00408CAABBCC"
-            default_filename = "mac_specific_ip_template.csv"
+        # Anything other than a sequential template falls back to MAC-specific
+        template_rows, default_filename = _CSV_TEMPLATES.get(template_type, _CSV_TEMPLATES["mac_specific"])
         
         # Let user choose where to save the template
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV Template", default_filename, "CSV Files (*.csv)"
+            self, "Save CSV Template", default_filename, "CSV Files (*.csv)",
+            options=self._file_dialog_opts
         )
         
         if file_path:
+            # Write to a temporary file first so an interrupted save never
+            # leaves a half-written template behind
+            tmp_path = file_path + ".tmp"
             try:
-                with open(file_path, 'w') as f:
-                    f.write(template_content)
+                with open(tmp_path, 'w', newline='') as f:
+                    csv.writer(f, lineterminator='\r\n').writerows(template_rows)
+                os.replace(tmp_path, file_path)
                 self.log_message.emit(f"CSV template saved to: {file_path}")
                 QMessageBox.information(self, "Template Saved", f"CSV template saved to: {file_path}")
             except Exception as e:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
                 self.log_message.emit(f"Error saving CSV template: {str(e)}")
                 QMessageBox.warning(self, "Error", f"Could not save CSV template: {str(e)}")
     
@@ -415,6 +452,13 @@ class NetworkConfigDialog(QDialog):
                 return  # Don't close dialog yet
             # If No, they might want to continue without a CSV, which could be handled elsewhere
         
+        # Hand the entries over as an immutable snapshot: a tuple of IPs for
+        # sequential mode, or a tuple of (mac, ip) pairs for MAC-specific mode
+        if isinstance(self.csv_entries, dict):
+            csv_entries = tuple(self.csv_entries.items())
+        else:
+            csv_entries = tuple(self.csv_entries)
+        
         # Collect settings to return
         settings = {
             'subnet_mask': subnet,
@@ -422,7 +466,7 @@ class NetworkConfigDialog(QDialog):
             'protocol': self.vapix_protocol.currentText(),
             'ip_mode': 'mac_specific' if self.mac_specific_radio.isChecked() else 'sequential',
             'csv_path': self.csv_path,
-            'csv_entries': self.csv_entries
+            'csv_entries': csv_entries
         }
         
         # Emit signal with settings
@@ -434,7 +478,7 @@ class NetworkConfigDialog(QDialog):
     def save_settings_as_default(self):
         """Save the current network settings as default values"""
         try:
-            settings = QSettings("AxisAutoConfig", "SetupTool")
+            settings = self._settings
             
             # Save basic network settings
             settings.setValue("DefaultSubnetMask", self.subnet_mask.text().strip())
@@ -445,6 +489,9 @@ class NetworkConfigDialog(QDialog):
             mode = "mac_specific" if self.mac_specific_radio.isChecked() else "sequential"
             settings.setValue("DefaultIPMode", mode)
             
+            # Flush all four values to the settings backend in one go
+            settings.sync()
+            
             # Show confirmation message
             QMessageBox.information(
                 self,
@@ -7,13 +7,40 @@ Dialog for user creation workflow
 """
 
 import logging
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
                              QLabel, QLineEdit, QPushButton, QGroupBox,
-                             QSpacerItem, QSizePolicy, QDialogButtonBox,
-                             QMessageBox)
+                             QSpacerItem, QSizePolicy, QDialogButtonBox)
 from PySide6.QtCore import Qt
 
 
+# Styles for the whole dialog, matched by object name or the "invalid" property
+# so Qt parses one stylesheet instead of one per widget
+_DIALOG_STYLE = (
+    "QLabel#helpLabel { font-size: 11px; color: #888; }"
+    "QLabel#errorLabel { color: #c80000; }"
+    'QLineEdit[invalid="true"] { border: 1px solid #c80000; }'
+)
+
+# (group title, [(label, attribute name, placeholder, echo mode), ...]) for each
+# step of the workflow; an attribute of None shows the placeholder as fixed text
+_FIELD_GROUPS = (
+    ("Step 1: Root Admin (First Admin)", (
+        ("Root Administrator Username:", None, "root (required by Axis OS v10)", None),
+        ("Root Administrator Password:", "root_password", "Required", QLineEdit.Password),
+    )),
+    ("Step 2: Secondary Administrator (Optional)", (
+        ("Secondary Administrator Username:", "secondary_username",
+         "Optional - custom admin name", QLineEdit.Normal),
+        ("Secondary Administrator Password:", "secondary_password",
+         "Optional - leave blank to use root password", QLineEdit.Password),
+    )),
+    ("Step 3: ONVIF User", (
+        ("ONVIF Username to Create:", "onvif_username", "For ONVIF client access", QLineEdit.Normal),
+        ("ONVIF Password to Set:", "onvif_password", None, QLineEdit.Password),
+    )),
+)
+
+
 class UserCreationDialog(QDialog):
     """Dialog for the three-user creation workflow"""
     
@@ -28,6 +55,8 @@ class UserCreationDialog(QDialog):
         if parent:
             self.setPalette(parent.palette())
         
+        self.setStyleSheet(_DIALOG_STYLE)
+        
         # Initialize UI
         self.init_ui()
     
@@ -44,55 +73,22 @@ class UserCreationDialog(QDialog):
         explanation.setWordWrap(True)
         main_layout.addWidget(explanation)
         
-        # Step 1: Root Admin
-        root_group = QGroupBox("Step 1: Root Admin (First Admin)")
-        root_layout = QGridLayout(root_group)
-        
-        # Root Admin Username (fixed as 'root')
-        root_layout.addWidget(QLabel("Root Administrator Username:"), 0, 0)
-        root_layout.addWidget(QLabel("root (required by Axis OS v10)"), 0, 1)
-        
-        # Root Admin Password
-        root_layout.addWidget(QLabel("Root Administrator Password:"), 1, 0)
-        self.root_password = QLineEdit()
-        self.root_password.setEchoMode(QLineEdit.Password)
-        self.root_password.setPlaceholderText("Required")
-        root_layout.addWidget(self.root_password, 1, 1)
-        
-        main_layout.addWidget(root_group)
-        
-        # Step 2: Secondary Admin
-        secondary_group = QGroupBox("Step 2: Secondary Administrator (Optional)")
-        secondary_layout = QGridLayout(secondary_group)
-        
-        secondary_layout.addWidget(QLabel("Secondary Administrator Username:"), 0, 0)
-        self.secondary_username = QLineEdit()
-        self.secondary_username.setPlaceholderText("Optional - custom admin name")
-        secondary_layout.addWidget(self.secondary_username, 0, 1)
-        
-        secondary_layout.addWidget(QLabel("Secondary Administrator Password:"), 1, 0)
-        self.secondary_password = QLineEdit()
-        self.secondary_password.setEchoMode(QLineEdit.Password)
-        self.secondary_password.setPlaceholderText("Optional - leave blank to use root password")
-        secondary_layout.addWidget(self.secondary_password, 1, 1)
-        
-        main_layout.addWidget(secondary_group)
-        
-        # Step 3: ONVIF User
-        onvif_group = QGroupBox("Step 3: ONVIF User")
-        onvif_layout = QGridLayout(onvif_group)
-        
-        onvif_layout.addWidget(QLabel("ONVIF Username to Create:"), 0, 0)
-        self.onvif_username = QLineEdit()
-        self.onvif_username.setPlaceholderText("For ONVIF client access")
-        onvif_layout.addWidget(self.onvif_username, 0, 1)
-        
-        onvif_layout.addWidget(QLabel("ONVIF Password to Set:"), 1, 0)
-        self.onvif_password = QLineEdit()
-        self.onvif_password.setEchoMode(QLineEdit.Password)
-        onvif_layout.addWidget(self.onvif_password, 1, 1)
-        
-        main_layout.addWidget(onvif_group)
+        # One group box per step, with a label/field row per credential
+        for title, fields in _FIELD_GROUPS:
+            group = QGroupBox(title)
+            form = QFormLayout(group)
+            for label, attr, placeholder, echo_mode in fields:
+                if attr is None:
+                    # Fixed value shown for information only
+                    form.addRow(label, QLabel(placeholder))
+                    continue
+                field = QLineEdit()
+                field.setEchoMode(echo_mode)
+                if placeholder:
+                    field.setPlaceholderText(placeholder)
+                setattr(self, attr, field)
+                form.addRow(label, field)
+            main_layout.addWidget(group)
         
         # Help text
         help_text = QLabel(
@@ -101,29 +97,57 @@ class UserCreationDialog(QDialog):
             "users will be created if usernames are provided."
         )
         help_text.setWordWrap(True)
-        help_text.setStyleSheet("font-size: 11px; color: #888;")
+        help_text.setObjectName("helpLabel")
         main_layout.addWidget(help_text)
         
+        # Validation errors are shown inline instead of in a message box
+        self.error_label = QLabel()
+        self.error_label.setWordWrap(True)
+        self.error_label.setObjectName("errorLabel")
+        self.error_label.hide()
+        main_layout.addWidget(self.error_label)
+        
+        # Clear a field's highlight as soon as the user edits it
+        for field in (self.root_password, self.onvif_username, self.onvif_password):
+            field.textChanged.connect(lambda _text, f=field: self._set_invalid(f, False))
+        
         # Standard dialog buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.validate_and_accept)
         button_box.rejected.connect(self.reject)
         main_layout.addWidget(button_box)
     
+    @staticmethod
+    def _set_invalid(field, invalid):
+        """Toggle the validation highlight on a field"""
+        if field.property("invalid") == invalid:
+            return
+        field.setProperty("invalid", invalid)
+        # Dynamic property changes only restyle after a repolish
+        field.style().unpolish(field)
+        field.style().polish(field)
+    
     def validate_and_accept(self):
         """Validate inputs before accepting dialog"""
+        errors = []
+        
         # Check that root password is provided
-        if not self.root_password.text():
-            QMessageBox.warning(self, "Missing Required Field",
-                              "Root Administrator Password is required.")
-            return
-            
+        root_missing = not self.root_password.text()
+        self._set_invalid(self.root_password, root_missing)
+        if root_missing:
+            errors.append("Root Administrator Password is required.")
+        
         # Check if ONVIF credentials are complete
         onvif_user = self.onvif_username.text()
         onvif_pass = self.onvif_password.text()
-        if (onvif_user and not onvif_pass) or (not onvif_user and onvif_pass):
-            QMessageBox.warning(self, "Incomplete ONVIF Credentials",
-                              "Please provide both ONVIF username and password, or leave both empty.")
+        self._set_invalid(self.onvif_username, bool(onvif_pass and not onvif_user))
+        self._set_invalid(self.onvif_password, bool(onvif_user and not onvif_pass))
+        if bool(onvif_user) != bool(onvif_pass):
+            errors.append("Please provide both ONVIF username and password, or leave both empty.")
+        
+        if errors:
+            self.error_label.setText(" ".join(errors))
+            self.error_label.show()
             return
         
         self.accept()
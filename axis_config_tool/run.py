@@ -7,10 +7,11 @@ Package entry point for installed package
 """
 
 import sys
-from axis_config_tool.gui.main_window import MainWindow
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import os
 
 
@@ -18,14 +19,22 @@ def setup_logging():
     """Set up logging configuration for the application"""
     log_file = "axis_config.log"
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Records are written by a background listener so logging calls from
+    # worker threads only enqueue and never wait on disk or console I/O
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = (logging.FileHandler(log_file), logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drain the queue before the interpreter exits
+    atexit.register(listener.stop)
     
     logging.info("Logging initialized")
 
@@ -35,13 +44,12 @@ def main():
     # Set up logging
     setup_logging()
     
-    # Create Qt application
+    # Create Qt application (high DPI scaling is always on in Qt 6)
     app = QApplication(sys.argv)
     app.setApplicationName("AxisAutoConfig")
     
-    # Enable high DPI scaling
-    app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Import the GUI only once Qt is up; it pulls in most of the package
+    from axis_config_tool.gui.main_window import MainWindow
     
     # Create and show main window
     main_window = MainWindow()
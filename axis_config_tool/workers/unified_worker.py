@@ -6,10 +6,41 @@ Axis Camera Unified Setup & Configuration Tool
 Worker threads for background operations
 """
 
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from PySide6.QtCore import QThread, Signal
 from axis_config_tool.core import network_utils
 
 
+# Status recorded for a camera that completed every configuration step
+STATUS_SUCCESS = sys.intern('Success')
+
+
+def _normalize_mac(mac):
+    """Strip separators and upper-case a MAC address for comparison"""
+    return mac.replace(':', '').replace('-', '').upper()
+
+
+def _resolve_final_ips(ip_mode, ip_list, cameras):
+    """
+    Return the final static IP for each camera, in camera order
+    
+    Sequential mode gives the Nth discovered camera the Nth IP in the list;
+    MAC-specific mode looks each camera up by MAC. Cameras without an IP get None.
+    """
+    if ip_mode == 'sequential':
+        return [ip_list[i] if i < len(ip_list) else None for i in range(len(cameras))]
+    
+    # Normalize the MAC keys once so each lookup is a single dict access
+    normalized_map = {_normalize_mac(m): ip for m, ip in ip_list.items()}
+    return [
+        ip_list.get(camera['mac']) or normalized_map.get(_normalize_mac(camera['mac']))
+        for camera in cameras
+    ]
+
+
 class DHCPWorker(QThread):
     """Worker thread for running the DHCP server"""
     
@@ -19,14 +50,14 @@ class DHCPWorker(QThread):
     def __init__(self, dhcp_manager):
         super().__init__()
         self.dhcp_manager = dhcp_manager
-        self._should_stop = False
-        
+        self._stop_event = threading.Event()
+    
     def run(self):
         """Run the DHCP server in a separate thread"""
         self.log_message.emit("Starting DHCP server thread...")
         try:
             self.status_update.emit("Running")
-            self.dhcp_manager.start(stop_event=self._should_stop)
+            self.dhcp_manager.start(stop_event=self._stop_event)
         except Exception as e:
             self.log_message.emit(f"DHCP server error: {str(e)}")
             self.status_update.emit("Error")
@@ -37,7 +68,7 @@ class DHCPWorker(QThread):
     def stop(self):
         """Signal the DHCP server to stop"""
         self.log_message.emit("Stopping DHCP server...")
-        self._should_stop = True
+        self._stop_event.set()
         self.dhcp_manager.stop()
         self.wait()  # Wait for the thread to finish
 
@@ -45,28 +76,54 @@ class DHCPWorker(QThread):
 class DiscoveryWorker(QThread):
     """Worker thread for camera discovery"""
     
-    camera_found = Signal(str, str)  # IP, MAC
+    cameras_batch = Signal(list)  # List of (IP, MAC) tuples
     log_message = Signal(str)
     
+    # Found cameras are reported in batches of up to BATCH_SIZE, or sooner
+    # once BATCH_INTERVAL seconds have passed since the last report
+    BATCH_SIZE = 10
+    BATCH_INTERVAL = 0.25
+    
+    # Maximum number of devices probed at the same time
+    MAX_CONCURRENT_PROBES = 64
+    
     def __init__(self, camera_discovery, leases):
         super().__init__()
         self.camera_discovery = camera_discovery
         self.leases = leases
-        
+    
     def run(self):
         """Run the camera discovery process in a separate thread"""
         self.log_message.emit(f"Starting camera discovery for {len(self.leases)} potential devices...")
         
+        batch = []
+        last_emit = time.monotonic()
         try:
-            for ip, mac in self.leases:
-                try:
-                    if self.camera_discovery.check_device(ip):
-                        self.camera_found.emit(ip, mac)
-                except Exception as e:
-                    self.log_message.emit(f"Error checking device at {ip}: {str(e)}")
+            # Probes are network-bound, so check several devices concurrently
+            workers = max(1, min(self.MAX_CONCURRENT_PROBES, len(self.leases)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self.camera_discovery.check_device, ip): (ip, mac)
+                    for ip, mac in self.leases
+                }
+                for future in as_completed(futures):
+                    ip, mac = futures[future]
+                    try:
+                        if future.result():
+                            batch.append((ip, mac))
+                    except Exception as e:
+                        self.log_message.emit(f"Error checking device at {ip}: {str(e)}")
+
+                    if batch and (len(batch) >= self.BATCH_SIZE
+                                  or time.monotonic() - last_emit >= self.BATCH_INTERVAL):
+                        self.cameras_batch.emit(batch)
+                        batch = []
+                        last_emit = time.monotonic()
         except Exception as e:
             self.log_message.emit(f"Discovery process error: {str(e)}")
         finally:
+            if batch:
+                self.cameras_batch.emit(batch)
             self.log_message.emit("Discovery process completed")
 
 
@@ -74,10 +131,25 @@ class ConfigurationWorker(QThread):
     """Worker thread for camera configuration"""
     
     progress_update = Signal(int, int)  # current, total
-    camera_configured = Signal(str, bool, dict)  # IP, success, details
+    camera_configured = Signal(str, bool, dict)  # IP, success, details (used for failures)
+    camera_configured_batch = Signal(list)  # List of (IP, details) for successful cameras
     log_message = Signal(str)
+    log_batch = Signal(list)  # Log lines buffered by the pool threads
     configuration_complete = Signal(list)  # List of results for all cameras
     
+    # Successful cameras are reported in batches of up to BATCH_SIZE, or sooner
+    # once BATCH_INTERVAL seconds have passed since the last report
+    BATCH_SIZE = 16
+    BATCH_INTERVAL = 0.1
+    
+    # Log lines are sent to the GUI in batches of up to LOG_BATCH_SIZE, or
+    # sooner once LOG_BATCH_INTERVAL seconds have passed since the last batch
+    LOG_BATCH_SIZE = 32
+    LOG_BATCH_INTERVAL = 0.1
+    
+    # Maximum number of cameras configured at the same time
+    MAX_PARALLEL_CAMERAS = 16
+    
     def __init__(self, camera_operations, cameras, config_params):
         """
         Initialize the configuration worker
@@ -92,20 +164,52 @@ class ConfigurationWorker(QThread):
                     'subnet_mask': str, 'gateway': str,
                     'protocol': str,
                     'ip_mode': 'sequential' or 'mac_specific',
-                    'ip_list': [str] or {'mac': 'ip'} depending on mode
+                    'ip_list': sequence of IPs, or {'mac': 'ip'} / sequence of
+                               (mac, ip) pairs, depending on mode
                 }
         """
         super().__init__()
         self.camera_operations = camera_operations
         self.cameras = cameras
         self.config_params = config_params
-        self._should_stop = False
+        self._stop_event = threading.Event()
         self.results = []  # Will store configuration results for reporting
-        
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        self._last_log_flush = time.monotonic()
+    
+    def _log(self, message):
+        """Queue a log line for the GUI, flushing when the batch is full or stale"""
+        with self._log_lock:
+            self._log_buf.append(message)
+            if (len(self._log_buf) < self.LOG_BATCH_SIZE
+                    and time.monotonic() - self._last_log_flush < self.LOG_BATCH_INTERVAL):
+                return
+            lines = self._log_buf
+            self._log_buf = []
+            self._last_log_flush = time.monotonic()
+        self.log_batch.emit(lines)
+    
+    def _flush_log(self):
+        """Send any buffered log lines to the GUI"""
+        with self._log_lock:
+            lines = self._log_buf
+            self._log_buf = []
+            self._last_log_flush = time.monotonic()
+        if lines:
+            self.log_batch.emit(lines)
+    
     def run(self):
         """Run the camera configuration process in a separate thread"""
-        self.log_message.emit("Camera configuration process started")
-        self.log_message.emit(f"Found {len(self.cameras)} camera(s) to configure")
+        try:
+            self._run_configuration()
+        finally:
+            self._flush_log()
+    
+    def _run_configuration(self):
+        """Validate the parameters and configure every camera"""
+        self._log("Camera configuration process started")
+        self._log(f"Found {len(self.cameras)} camera(s) to configure")
         
         # Extract configuration parameters
         admin_user = self.config_params.get('admin_user', '')
@@ -122,236 +226,320 @@ class ConfigurationWorker(QThread):
         
         # For OS version 10, we will always use 'root' as the admin username
         # regardless of what was provided by the user
-        actual_admin_user = 'root'
         if admin_user != 'root':
-            self.log_message.emit(f"Note: Provided admin username '{admin_user}' will be overridden with 'root' as required by Axis OS v10")
+            self._log(f"Note: Provided admin username '{admin_user}' will be overridden with 'root' as required by Axis OS v10")
         
         # Validation
         if not admin_pass:
-            self.log_message.emit("Error: Admin password is required")
+            self._log("Error: Admin password is required")
             return
         
         if not self.cameras:
-            self.log_message.emit("Error: No cameras to configure")
+            self._log("Error: No cameras to configure")
             return
-            
+        
         # IP assignment validation/preparation
-        if ip_mode == 'sequential' and (not ip_list or not isinstance(ip_list, list)):
-            self.log_message.emit("Error: Sequential IP mode requires a list of IP addresses")
-            return
-            
-        if ip_mode == 'mac_specific' and (not ip_list or not isinstance(ip_list, dict)):
-            self.log_message.emit("Error: MAC-specific IP mode requires a mapping of MAC addresses to IP addresses")
+        if ip_mode == 'sequential' and (not ip_list or not isinstance(ip_list, (list, tuple))):
+            self._log("Error: Sequential IP mode requires a list of IP addresses")
             return
         
-        # Initialize the sequential IP counter if needed
-        sequential_ip_index = 0
-            
-        # Process each discovered camera
+        if ip_mode == 'mac_specific':
+            if not ip_list or not isinstance(ip_list, (dict, list, tuple)):
+                self._log("Error: MAC-specific IP mode requires a mapping of MAC addresses to IP addresses")
+                return
+            # Build the lookup table once rather than searching per camera
+            ip_list = dict(ip_list)
+        
+        settings = {
+            'admin_pass': admin_pass,
+            'secondary_username': secondary_username,
+            'secondary_pass': secondary_pass,
+            'onvif_user': onvif_user,
+            'onvif_pass': onvif_pass,
+            'subnet_mask': subnet_mask,
+            'gateway': gateway,
+            'protocol': protocol,
+            'ip_mode': ip_mode,
+        }
+        
+        # Successful results waiting to be reported to the GUI
+        configured_batch = []
+        last_batch_emit = time.monotonic()
+        
+        # Resolve every camera's final IP up front, in discovery order, so the
+        # assignment does not depend on which pool thread reaches step 6 first
+        final_ips = _resolve_final_ips(ip_mode, ip_list, self.cameras)
+        
+        # Cameras are independent and mostly wait on the network, so configure them in parallel
         total_cameras = len(self.cameras)
-        for i, camera in enumerate(self.cameras):
-            if self._should_stop:
-                self.log_message.emit("Camera configuration process stopped by user")
-                break
-                
-            temp_ip = camera['ip']
-            mac = camera['mac']
-            
-            self.progress_update.emit(i + 1, total_cameras)
-            self.log_message.emit(f"Processing camera {i + 1} of {total_cameras} at temporary IP {temp_ip}")
-            
-            # Dictionary to track operations and results for this camera
-            camera_result = {
-                'temp_ip': temp_ip,
-                'mac': mac,
-                'operations': {},
-                'final_ip': None,
-                'status': 'Processing'
-            }
-            
-            # Step 1: Create initial root admin user
-            self.log_message.emit(f"Creating root administrator on {temp_ip}...")
-            root_success, root_message = self.camera_operations.create_initial_admin(
-                temp_ip, 'root', admin_pass, protocol
-            )
-            
-            camera_result['operations']['root_admin'] = {
-                'success': root_success,
-                'message': root_message
+        completed = 0
+        success_count = 0
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_CAMERAS, total_cameras),
+                                thread_name_prefix='camera-config') as executor:
+            futures = {
+                executor.submit(self._configure_one, i, camera, final_ips[i], settings): camera
+                for i, camera in enumerate(self.cameras)
             }
-            
-            if not root_success:
-                self.log_message.emit(f"Failed to create root admin on {temp_ip}: {root_message}")
-                camera_result['status'] = 'Failed - Root Admin Creation'
-                self.results.append(camera_result)
-                self.camera_configured.emit(temp_ip, False, camera_result)
-                continue
-                
-            self.log_message.emit(f"Root admin created or verified on {temp_ip}")
-            
-            # Step 2: Create secondary admin user with custom username
-            # Only if a secondary username was specified
-            if secondary_username:
-                self.log_message.emit(f"Creating secondary admin user '{secondary_username}' on {temp_ip}...")
-                # Use root credentials to authenticate, but create the secondary user with its own password
-                secondary_success, secondary_message = self.camera_operations.create_secondary_admin(
-                    temp_ip, 'root', admin_pass, secondary_username, secondary_pass, protocol
-                )
-                
-                camera_result['operations']['secondary_admin'] = {
-                    'success': secondary_success,
-                    'message': secondary_message
-                }
-                
-                if not secondary_success:
-                    self.log_message.emit(f"Failed to create secondary admin user '{secondary_username}' on {temp_ip}: {secondary_message}")
-                    # Continue anyway - not critical as we have root
-                else:
-                    self.log_message.emit(f"Secondary admin user '{secondary_username}' created on {temp_ip}")
-            
-            # Step 3: Create ONVIF user if needed - always authenticate as root
-            if onvif_user and onvif_pass:
-                self.log_message.emit(f"Creating ONVIF user '{onvif_user}' on {temp_ip}...")
-                onvif_success, onvif_message = self.camera_operations.create_onvif_user(
-                    temp_ip, 'root', admin_pass, onvif_user, onvif_pass, protocol
-                )
+            # Wake up at least every LOG_BATCH_INTERVAL so log lines written before a
+            # long blocking step reach the GUI even when no camera finishes
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, timeout=self.LOG_BATCH_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        camera_result = future.result()
+                    except Exception as e:
+                        camera = futures[future]
+                        self._log(f"Unexpected error configuring camera at {camera['ip']}: {str(e)}")
+                        camera_result = {
+                            'temp_ip': camera['ip'],
+                            'mac': camera['mac'],
+                            'operations': {},
+                            'final_ip': None,
+                            'status': 'Failed - Unexpected Error'
+                        }
+                    
+                    if camera_result is None:
+                        continue  # Skipped because a stop was requested
+                    
+                    completed += 1
+                    self.progress_update.emit(completed, total_cameras)
+                    self.results.append(camera_result)
+                    
+                    if camera_result['status'] == STATUS_SUCCESS:
+                        success_count += 1
+                        configured_batch.append((camera_result['final_ip'], camera_result))
+                    else:
+                        self.camera_configured.emit(camera_result['temp_ip'], False, camera_result)
                 
-                camera_result['operations']['onvif_user'] = {
-                    'success': onvif_success,
-                    'message': onvif_message
-                }
+                # Checked on every tick so a finished camera is reported without
+                # waiting for the next one to complete
+                if configured_batch and (len(configured_batch) >= self.BATCH_SIZE
+                                         or time.monotonic() - last_batch_emit >= self.BATCH_INTERVAL):
+                    self.camera_configured_batch.emit(configured_batch)
+                    configured_batch = []
+                    last_batch_emit = time.monotonic()
                 
-                if not onvif_success:
-                    self.log_message.emit(f"Failed to create ONVIF user on {temp_ip}: {onvif_message}")
-                    # Continue anyway - not critical
-                else:
-                    self.log_message.emit(f"ONVIF user created or verified on {temp_ip}")
-            
-            # Step 4: Set WDR off - always authenticate as root
-            self.log_message.emit(f"Setting WDR off on {temp_ip}...")
-            wdr_success, wdr_message = self.camera_operations.set_wdr_off(
-                temp_ip, 'root', admin_pass, protocol
+                self._flush_log()
+        
+        if self._stop_event.is_set():
+            self._log("Camera configuration process stopped by user")
+        
+        if configured_batch:
+            self.camera_configured_batch.emit(configured_batch)
+        
+        self._log(f"Camera configuration process completed for {len(self.cameras)} cameras")
+        
+        # Success/failure statistics
+        self._log(f"Results: {success_count} of {len(self.cameras)} cameras successfully configured")
+        
+        # Emit signal with all results for reporting, after the log has caught up
+        self._flush_log()
+        self.configuration_complete.emit(self.results)
+    
+    def _configure_one(self, index, camera, final_ip, settings):
+        """
+        Run every configuration step against a single camera
+        
+        Called on a pool thread; returns the camera's result dictionary, or
+        None if a stop was requested before the camera was started.
+        """
+        if self._stop_event.is_set():
+            return None
+        
+        from axis_config_tool.core.camera_operations import CameraSession
+        
+        # One keep-alive session carries every request to the camera's temporary IP
+        with CameraSession() as session:
+            return self._configure_camera(index, camera, final_ip, settings, session)
+    
+    def _configure_camera(self, index, camera, final_ip, settings, session):
+        """Configure one camera using the given session for its temporary IP"""
+        admin_pass = settings['admin_pass']
+        secondary_username = settings['secondary_username']
+        secondary_pass = settings['secondary_pass']
+        onvif_user = settings['onvif_user']
+        onvif_pass = settings['onvif_pass']
+        subnet_mask = settings['subnet_mask']
+        gateway = settings['gateway']
+        protocol = settings['protocol']
+        ip_mode = settings['ip_mode']
+        total_cameras = len(self.cameras)
+        
+        temp_ip = camera['ip']
+        mac = camera['mac']
+        # Every step authenticates as root with the same password and protocol
+        auth = ('root', admin_pass, protocol)
+        
+        self._log(f"Processing camera {index + 1} of {total_cameras} at temporary IP {temp_ip}")
+        
+        # Dictionary to track operations and results for this camera
+        camera_result = {
+            'temp_ip': temp_ip,
+            'mac': mac,
+            'operations': {},
+            'final_ip': None,
+            'status': 'Processing'
+        }
+        
+        # Step 1: Create initial root admin user
+        self._log(f"Creating root administrator on {temp_ip}...")
+        root_success, root_message = self._step(
+            camera_result, 'root_admin', session, self.camera_operations.create_initial_admin, temp_ip, *auth
+        )
+        
+        if not root_success:
+            self._log(f"Failed to create root admin on {temp_ip}: {root_message}")
+            camera_result['status'] = 'Failed - Root Admin Creation'
+            return camera_result
+        
+        self._log(f"Root admin created or verified on {temp_ip}")
+        
+        # Step 2: Create secondary admin user with custom username
+        # Only if a secondary username was specified
+        if secondary_username:
+            self._log(f"Creating secondary admin user '{secondary_username}' on {temp_ip}...")
+            # Use root credentials to authenticate, but create the secondary user with its own password
+            secondary_success, secondary_message = self._step(
+                camera_result, 'secondary_admin', session, self.camera_operations.create_secondary_admin,
+                temp_ip, admin_pass, secondary_username, secondary_pass, protocol
             )
             
-            camera_result['operations']['wdr_off'] = {
-                'success': wdr_success,
-                'message': wdr_message
-            }
+            if not secondary_success:
+                self._log(f"Failed to create secondary admin user '{secondary_username}' on {temp_ip}: {secondary_message}")
+                # Continue anyway - not critical as we have root
+            else:
+                self._log(f"Secondary admin user '{secondary_username}' created on {temp_ip}")
+        
+        # Step 3: Create ONVIF user if needed - always authenticate as root
+        if onvif_user and onvif_pass:
+            self._log(f"Creating ONVIF user '{onvif_user}' on {temp_ip}...")
+            onvif_success, onvif_message = self._step(
+                camera_result, 'onvif_user', session, self.camera_operations.create_onvif_user,
+                temp_ip, 'root', admin_pass, onvif_user, onvif_pass, protocol
+            )
             
-            if not wdr_success:
-                self.log_message.emit(f"Failed to turn off WDR on {temp_ip}: {wdr_message}")
+            if not onvif_success:
+                self._log(f"Failed to create ONVIF user on {temp_ip}: {onvif_message}")
                 # Continue anyway - not critical
             else:
-                self.log_message.emit(f"WDR turned off on {temp_ip}")
-            
-            # Step 5: Set Replay Protection off - always authenticate as root
-            self.log_message.emit(f"Setting Replay Protection off on {temp_ip}...")
-            replay_success, replay_message = self.camera_operations.set_replay_protection_off(
-                temp_ip, 'root', admin_pass, protocol
+                self._log(f"ONVIF user created or verified on {temp_ip}")
+        
+        # Read the current WDR/Replay Protection settings once so steps 4 and 5
+        # can be skipped when the camera already has them turned off
+        _, image_params = self.camera_operations.get_image_params(temp_ip, *auth, session=session)
+        
+        # Step 4: Set WDR off - always authenticate as root
+        if image_params.get('wdr') == 'off':
+            camera_result['operations']['wdr_off'] = {'success': True, 'message': 'WDR already off (skipped)'}
+            self._log(f"WDR already off on {temp_ip}")
+        else:
+            self._log(f"Setting WDR off on {temp_ip}...")
+            wdr_success, wdr_message = self._step(
+                camera_result, 'wdr_off', session, self.camera_operations.set_wdr_off, temp_ip, *auth
             )
             
+            if not wdr_success:
+                self._log(f"Failed to turn off WDR on {temp_ip}: {wdr_message}")
+                # Continue anyway - not critical
+            else:
+                self._log(f"WDR turned off on {temp_ip}")
+        
+        # Step 5: Set Replay Protection off - always authenticate as root
+        if image_params.get('replay_protection') == 'off':
             camera_result['operations']['replay_protection_off'] = {
-                'success': replay_success,
-                'message': replay_message
+                'success': True,
+                'message': 'Replay Protection already off (skipped)'
             }
+            self._log(f"Replay Protection already off on {temp_ip}")
+        else:
+            self._log(f"Setting Replay Protection off on {temp_ip}...")
+            replay_success, replay_message = self._step(
+                camera_result, 'replay_protection_off', session, self.camera_operations.set_replay_protection_off,
+                temp_ip, *auth
+            )
             
             if not replay_success:
-                self.log_message.emit(f"Failed to turn off Replay Protection on {temp_ip}: {replay_message}")
+                self._log(f"Failed to turn off Replay Protection on {temp_ip}: {replay_message}")
                 # Continue anyway - not critical
             else:
-                self.log_message.emit(f"Replay Protection turned off on {temp_ip}")
-            
-            # Step 6: Determine final static IP based on mode
-            try:
-                final_ip = None
-                
+                self._log(f"Replay Protection turned off on {temp_ip}")
+        
+        # Step 6: Check the final static IP assigned to this camera
+        try:
+            if not final_ip:
                 if ip_mode == 'sequential':
-                    # Check if we still have IPs available in the list
-                    if sequential_ip_index < len(ip_list):
-                        final_ip = ip_list[sequential_ip_index]
-                        sequential_ip_index += 1
-                    else:
-                        self.log_message.emit(f"Error: No more IP addresses available in sequential list for {temp_ip}")
-                        camera_result['status'] = 'Failed - No Available IP'
-                        self.results.append(camera_result)
-                        self.camera_configured.emit(temp_ip, False, camera_result)
-                        continue
-                        
-                elif ip_mode == 'mac_specific':
-                    # Try to find the MAC address in the mapping
-                    # First try exact match, then normalize and try again
-                    if mac in ip_list:
-                        final_ip = ip_list[mac]
-                    else:
-                        # Try normalized MAC (remove colons, uppercase)
-                        normalized_mac = mac.replace(':', '').upper()
-                        for map_mac, map_ip in ip_list.items():
-                            if map_mac.replace(':', '').upper() == normalized_mac:
-                                final_ip = map_ip
-                                break
-                                
-                    if not final_ip:
-                        self.log_message.emit(f"Error: No IP mapping found for MAC {mac}")
-                        camera_result['status'] = 'Failed - No MAC Match'
-                        self.results.append(camera_result)
-                        self.camera_configured.emit(temp_ip, False, camera_result)
-                        continue
-                
-                # Validate the final IP
-                if not network_utils.validate_ip_address(final_ip):
-                    self.log_message.emit(f"Error: Invalid IP address format: {final_ip}")
-                    camera_result['status'] = 'Failed - Invalid IP'
-                    self.results.append(camera_result)
-                    self.camera_configured.emit(temp_ip, False, camera_result)
-                    continue
-                    
-                self.log_message.emit(f"Final static IP for {temp_ip} determined as {final_ip}")
-                
-            except Exception as e:
-                self.log_message.emit(f"Error determining final IP for {temp_ip}: {str(e)}")
-                camera_result['status'] = 'Failed - IP Assignment Error'
-                self.results.append(camera_result)
-                self.camera_configured.emit(temp_ip, False, camera_result)
-                continue
-            
-            # Step 7: Set final static IP - always authenticate as root
-            ip_config = {
-                'ip': final_ip,
-                'subnet': subnet_mask,
-                'gateway': gateway
-            }
-            
-            self.log_message.emit(f"Setting static IP {final_ip} on {temp_ip}...")
-            ip_success, ip_message = self.camera_operations.set_final_static_ip(
-                temp_ip, 'root', admin_pass, ip_config, protocol
-            )
-            
-            camera_result['operations']['set_static_ip'] = {
-                'success': ip_success,
-                'message': ip_message
-            }
+                    self._log(f"Error: No more IP addresses available in sequential list for {temp_ip}")
+                    camera_result['status'] = 'Failed - No Available IP'
+                else:
+                    self._log(f"Error: No IP mapping found for MAC {mac}")
+                    camera_result['status'] = 'Failed - No MAC Match'
+                return camera_result
             
-            if not ip_success:
-                self.log_message.emit(f"Failed to set static IP on {temp_ip}: {ip_message}")
-                camera_result['status'] = 'Failed - IP Configuration'
-                self.results.append(camera_result)
-                self.camera_configured.emit(temp_ip, False, camera_result)
-                continue
-                
-            self.log_message.emit(f"Static IP set to {final_ip} on camera (previously {temp_ip})")
-            camera_result['final_ip'] = final_ip
+            # Validate the final IP
+            ip_valid, ip_error = network_utils.validate_ip_address(final_ip)
+            if not ip_valid:
+                self._log(f"Error: Invalid IP address {final_ip}: {ip_error}")
+                camera_result['status'] = 'Failed - Invalid IP'
+                return camera_result
             
+            self._log(f"Final static IP for {temp_ip} determined as {final_ip}")
+        
+        except Exception as e:
+            self._log(f"Error determining final IP for {temp_ip}: {str(e)}")
+            camera_result['status'] = 'Failed - IP Assignment Error'
+            return camera_result
+        
+        # Step 7: Set final static IP - always authenticate as root
+        ip_config = {
+            'ip': final_ip,
+            'subnet': subnet_mask,
+            'gateway': gateway
+        }
+        
+        self._log(f"Setting static IP {final_ip} on {temp_ip}...")
+        ip_success, ip_message = self._step(
+            camera_result, 'set_static_ip', session, self.camera_operations.set_final_static_ip,
+            temp_ip, 'root', admin_pass, ip_config, protocol
+        )
+        
+        if not ip_success:
+            self._log(f"Failed to set static IP on {temp_ip}: {ip_message}")
+            camera_result['status'] = 'Failed - IP Configuration'
+            return camera_result
+        
+        self._log(f"Static IP set to {final_ip} on camera (previously {temp_ip})")
+        camera_result['final_ip'] = final_ip
+        
+        # Connections to the temporary IP are useless now, so verify on a fresh session
+        self._verify_final_ip(index, camera_result, final_ip, admin_pass, protocol)
+        
+        return camera_result
+    
+    def _step(self, camera_result, name, session, operation, *args):
+        """Run one camera operation and record its outcome under the given name"""
+        success, message = operation(*args, session=session)
+        camera_result['operations'][name] = {'success': success, 'message': message}
+        return success, message
+    
+    def _verify_final_ip(self, index, camera_result, final_ip, admin_pass, protocol):
+        """Wait for a camera to come up on its final IP and record its MAC/serial"""
+        from axis_config_tool.core.camera_operations import CameraSession
+        
+        with CameraSession() as session:
             # Step 8: Wait for camera to come back online with new IP
             wait_time = 60  # seconds
-            self.log_message.emit(f"Waiting for camera to come online at {final_ip} (up to {wait_time} seconds)...")
+            self._log(f"Waiting for camera to come online at {final_ip} (up to {wait_time} seconds)...")
             
-            if network_utils.wait_for_camera_online(final_ip, 'root', admin_pass, protocol, wait_time):
-                self.log_message.emit(f"Camera successfully came online at {final_ip}")
+            online, elapsed = network_utils.wait_for_camera_online(final_ip, 'root', admin_pass, protocol, wait_time,
+                                                                   session=session)
+            if online:
+                self._log(f"Camera successfully came online at {final_ip} after {elapsed:.1f} seconds")
                 
                 # Step 9: Get final MAC/serial for verification - always authenticate as root
-                self.log_message.emit(f"Retrieving MAC and serial number from {final_ip}...")
+                self._log(f"Retrieving MAC and serial number from {final_ip}...")
                 info_success, info_data = self.camera_operations.get_camera_mac_serial(
-                    final_ip, 'root', admin_pass, protocol
+                    final_ip, 'root', admin_pass, protocol, session=session
                 )
                 
                 if info_success:
@@ -359,34 +547,19 @@ class ConfigurationWorker(QThread):
                     verified_mac = info_data.get('mac', '')
                     if verified_mac:
                         camera_result['verified_mac'] = verified_mac
-                        
-                    self.log_message.emit(f"Retrieved information from {final_ip}: MAC={verified_mac}, Serial={camera_result.get('serial', 'N/A')}")
+                    
+                    self._log(f"Retrieved information from {final_ip}: MAC={verified_mac}, Serial={camera_result.get('serial', 'N/A')}")
                 else:
-                    self.log_message.emit(f"Could not retrieve MAC/serial from {final_ip}")
+                    self._log(f"Could not retrieve MAC/serial from {final_ip}")
                 
                 # Mark as successfully configured
-                camera_result['status'] = 'Success'
-                self.results.append(camera_result)
-                self.camera_configured.emit(final_ip, True, camera_result)
-                self.log_message.emit(f"Camera {i + 1} successfully configured with IP {final_ip}")
+                camera_result['status'] = STATUS_SUCCESS
+                self._log(f"Camera {index + 1} successfully configured with IP {final_ip}")
             else:
-                self.log_message.emit(f"Camera did not come online at {final_ip} after configuration")
+                self._log(f"Camera did not come online at {final_ip} after configuration")
                 camera_result['status'] = 'Failed - Camera Offline After IP Change'
-                self.results.append(camera_result)
-                self.camera_configured.emit(temp_ip, False, camera_result)
-            
-        # End of camera processing loop
-        
-        self.log_message.emit(f"Camera configuration process completed for {len(self.cameras)} cameras")
-        
-        # Calculate success/failure statistics
-        success_count = len([r for r in self.results if r.get('status') == 'Success'])
-        self.log_message.emit(f"Results: {success_count} of {len(self.cameras)} cameras successfully configured")
-        
-        # Emit signal with all results for reporting
-        self.configuration_complete.emit(self.results)
     
     def stop(self):
         """Signal the configuration process to stop"""
-        self._should_stop = True
+        self._stop_event.set()
         self.log_message.emit("Requesting configuration process to stop...")
@@ -8,7 +8,10 @@ Main entry point for running from source
 
 import sys
 import os
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QTimer
@@ -17,22 +20,27 @@ from PySide6.QtGui import QIcon
 # Add the project root to the Python path if running from source
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-# Import from our package
-from axis_config_tool.gui.main_window import MainWindow
-
 
 def setup_logging():
     """Set up logging configuration for the application"""
     log_file = "axis_config.log"
     
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    # Records are written by a background listener so logging calls from
+    # worker threads only enqueue and never wait on disk or console I/O
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    handlers = (logging.FileHandler(log_file), logging.StreamHandler(sys.stdout))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Drain the queue before the interpreter exits
+    atexit.register(listener.stop)
     
     logging.info("Logging initialized")
 
@@ -42,7 +50,7 @@ def main():
     # Set up logging
     setup_logging()
     
-    # Create Qt application
+    # Create Qt application (high DPI scaling is always on in Qt 6)
     app = QApplication(sys.argv)
     app.setApplicationName("AxisAutoConfig")
     
@@ -51,9 +59,8 @@ def main():
     if os.path.exists(icon_path):
         app.setWindowIcon(QIcon(icon_path))
     
-    # Enable high DPI scaling
-    app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
-    app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    # Import the GUI only once Qt is up; it pulls in most of the package
+    from axis_config_tool.gui.main_window import MainWindow
     
     # Create and show main window
     main_window = MainWindow()
@@ -63,19 +70,24 @@ def main():
     # Ensure app exits when window is closed
     main_window.destroyed.connect(app.quit)
     
-    # Create resources directory if it doesn't exist
+    # One-time setup of the app icon in resources when running from source;
+    # once the icon is in place a marker file skips these checks on later launches
     resources_dir = os.path.join("axis_config_tool", "resources")
-    os.makedirs(resources_dir, exist_ok=True)
-    
-    # Check if app_icon.ico exists in current directory and copy to resources if needed
-    icon_source = "app_icon.ico"
-    icon_dest = os.path.join(resources_dir, "app_icon.ico")
-    
-    if os.path.exists(icon_source) and not os.path.exists(icon_dest):
-        import shutil
+    marker = os.path.join(resources_dir, ".initialized")
+    if not getattr(sys, 'frozen', False) and not os.path.exists(marker):
+        # Check if app_icon.ico exists in current directory and copy to resources if needed
+        icon_source = "app_icon.ico"
+        icon_dest = os.path.join(resources_dir, "app_icon.ico")
+        
         try:
-            shutil.copy2(icon_source, icon_dest)
-            logging.info(f"Copied app icon to {icon_dest}")
+            if not os.path.exists(icon_dest) and os.path.exists(icon_source):
+                import shutil
+                
+                os.makedirs(resources_dir, exist_ok=True)
+                shutil.copy2(icon_source, icon_dest)
+                logging.info(f"Copied app icon to {icon_dest}")
+            if os.path.exists(icon_dest):
+                open(marker, 'w').close()
         except Exception as e:
             logging.warning(f"Failed to copy app icon: {str(e)}")
     